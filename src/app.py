@@ -764,10 +764,9 @@ class IntentionalComputingApp(rumps.App):
                 # self.play_sound()
 
                 # Update the UI
-                current_raw_value = getattr(
-                    self.dashboard, "current_raw_value", 0.5
-                )  # Use existing raw value or neutral default
-                self.dashboard.update_intention_level(1, message, current_raw_value)
+                self.dashboard.update_intention_level(
+                    1, message, self.dashboard.current_raw_value
+                )
 
                 # Use the dashboard's current task
                 task = self.dashboard.current_task
@@ -979,10 +978,9 @@ class IntentionalComputingApp(rumps.App):
 
         # self.play_sound()
 
-        current_raw_value = getattr(
-            self.dashboard, "current_raw_value", 0.5
-        )  # Use existing raw value or neutral default
-        self.dashboard.update_intention_level(0, message, current_raw_value)
+        self.dashboard.update_intention_level(
+            0, message, self.dashboard.current_raw_value
+        )
 
         notification_id = f"focus_reminder_{int(time.time() * 1000)}"
 
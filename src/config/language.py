@@ -14,6 +14,7 @@ class LanguageManager:
     def __init__(self):
         self.current_language = "ko"  # Default to Korean
         self.translations = {}
+        self._template_cache = {}  # (language, key) -> raw template
         self.load_translations()
         self.load_language_setting()
 
@@ -261,12 +262,21 @@ class LanguageManager:
                 return True
         return False
 
+    def _get_template(self, language, key):
+        """Look up the raw (unformatted) template for key in language"""
+        cache_key = (language, key)
+        template = self._template_cache.get(cache_key)
+        if template is None:
+            template = self.translations[language].get(
+                key, self.translations["en"].get(key, f"[MISSING: {key}]")
+            )
+            self._template_cache[cache_key] = template
+        return template
+
     def get_text(self, key, **kwargs):
         """Get translated text for the given key"""
         try:
-            text = self.translations[self.current_language].get(
-                key, self.translations["en"].get(key, f"[MISSING: {key}]")
-            )
+            text = self._get_template(self.current_language, key)
 
             # Format the text with any provided kwargs
             if kwargs:
@@ -434,9 +434,9 @@ class ClarificationDialog(QWidget):
     def mouseMoveEvent(self, event):
         """Handle mouse movement to move window"""
         if self.oldPos:
-            delta = event.globalPosition().toPoint() - self.oldPos
-            self.move(self.pos() + delta)
-            self.oldPos = event.globalPosition().toPoint()
+            new_pos = event.globalPosition().toPoint()
+            self.move(self.pos() + new_pos - self.oldPos)
+            self.oldPos = new_pos
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to end window dragging"""
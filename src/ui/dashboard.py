@@ -11,6 +11,8 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QDialog,
     QSlider,
+    QMenu,
+    QApplication,
 )
 from PyQt6.QtCore import (
     Qt,
@@ -26,6 +28,8 @@ from PyQt6.QtCore import (
     QRect,
     QUrl,
     QEvent,
+    QSignalBlocker,
+    QFileSystemWatcher,
 )
 from PyQt6.QtGui import (
     QTextOption,
@@ -39,13 +43,24 @@ from PyQt6.QtGui import (
 
 import sys
 import objc
+import logging
 import json
 import os
 import requests
 import time
 import re
 from datetime import datetime
-from AppKit import NSWindow, NSWindowSharingNone
+from functools import lru_cache, partial
+from bisect import bisect_left
+from AppKit import (
+    NSApp,
+    NSFloatingWindowLevel,
+    NSWindow,
+    NSWindowSharingNone,
+    NSWorkspace,
+    NSWorkspaceDidActivateApplicationNotification,
+)
+from Foundation import NSObject
 from ctypes import c_void_p
 from ..config.constants import (
     APP_MODE,
@@ -56,6 +71,7 @@ from ..config.constants import (
     CLOUD_STORAGE_ENDPOINT,
 )
 from ..config.language import get_text
+from ..utils.activity import get_current_app_name, get_frontmost_app
 
 
 # Import new modular components
@@ -63,6 +79,11 @@ from .history_manager import TimelineWidget, HistoryManager
 from .window_manager import WindowManager
 from .llm_client import LLMClient
 from .feedback_manager import FeedbackManager
+from .dialogs import Dialogs
+from .notification import NotificationManager
+from .settings_dialog import UserSettingsDialog, LanguageSettingsDialog
+
+logger = logging.getLogger(__name__)
 
 # These will be updated by refresh_ui_language()
 TYPE_MESSAGE = get_text("type_message")
@@ -87,6 +108,150 @@ EXCLUDE_FROM_SCREEN_CAPTURE = (
 ANIMATION_SHOW_DURATION = 300  # Show animation duration in ms
 ANIMATION_HIDE_DURATION = 200  # Hide animation duration in ms
 ANIMATION_SLIDE_OFFSET = 20  # Slide animation offset in pixels
+DRAG_START_DISTANCE = 3  # Pixels the cursor must move before a press becomes a drag
+DRAG_FLUSH_INTERVAL = 16  # Apply coalesced drag moves at most once per frame (ms)
+OPACITY_FLUSH_INTERVAL = 16  # Apply coalesced opacity changes once per frame (ms)
+_STALE_FEEDBACK_SECONDS = 300  # Warn when feedback arrives this long after display
+
+# Characters kept in task names used for session ids (word chars, space, dash)
+_SANITIZE_RE = re.compile(r"[^\w \-]", re.UNICODE)
+
+# Texts of the other language that refresh_ui_language translates in place
+_START_BUTTON_TEXTS = frozenset({"Start", "시작"})
+_STOP_BUTTON_TEXTS = frozenset({"Stop", "중지"})
+_CLICK_MESSAGE_RE = re.compile("reset intention|재설정")
+_INSTRUCTION_START_RE = re.compile("start activity|시작하려면")
+_INSTRUCTION_FINISH_RE = re.compile("finish activity|마무리")
+
+# Hangul syllables, used to pick Korean vs English message variants
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+# Substrings of development apps that count as "in the intention app" when the
+# app's own process name is generic (python/main)
+_DEV_APP_KEYWORDS = (
+    "python",
+    "pycharm",
+    "vscode",
+    "terminal",
+    "iterm",
+    "intention",
+    "intentional",
+    "dash",
+    "cursor",  # Cursor IDE
+    "code",  # VS Code variants
+    "atom",  # Atom editor
+    "sublime",  # Sublime Text
+    "vim",  # Vim
+    "emacs",  # Emacs
+    "jupyter",  # Jupyter
+    "spyder",  # Spyder
+    "qtcreator",  # Qt Creator
+    "qt",  # Qt apps
+    "pyqt",  # PyQt apps
+)
+_APP_MATCH_CACHE_SIZE = 64  # Distinct frontmost app names remembered per intention app
+
+# Markdown code fences the LLM sometimes wraps around its JSON answers
+_CODE_FENCE_RE = re.compile(r"```(?:json)?")
+
+# Stand-in LLM response recorded with feedback when no analysis was displayed
+_FALLBACK_LLM_RESPONSE_JSON = """
+```json
+{
+    "reason": "unknown",
+    "output": 0.0
+}
+"""
+
+# Enum values checked on every event/keystroke, resolved once
+_MOUSE_PRESS = QEvent.Type.MouseButtonPress
+_LEFT_BUTTON = Qt.MouseButton.LeftButton
+_KEY_RETURN = Qt.Key.Key_Return
+_SHIFT_MODIFIER = Qt.KeyboardModifier.ShiftModifier
+
+# LLM response status by raw_value: <= 0.2 focused, <= 0.6 ambiguous, else distracted
+_STATUSES = ("focused", "ambiguous", "distracted")
+_STATUS_THRESHOLDS = (0.2, 0.6)
+
+# Settings (gear) menu style
+_SETTINGS_MENU_QSS = """
+    QMenu {
+        background-color: #2D2D2D;
+        border: 1px solid #555555;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    QMenu::item {
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background-color: #007AFF;
+    }
+"""
+
+# Clarification chat bubbles, indexed by is_user
+_CHAT_BUBBLE_QSS = (
+    """
+        background-color: #007AFF;
+        color: #FFFFFF;
+        border-radius: 12px;
+        padding: 8px 12px;
+        margin: 2px;
+        max-width: 250px;
+    """,  # AI message
+    """
+        background-color: #E5E5EA;
+        color: #000000;
+        border-radius: 12px;
+        padding: 8px 12px;
+        margin: 2px;
+        max-width: 250px;
+    """,  # User message
+)
+
+
+def _repolish(widget):
+    """Re-apply the stylesheet after a property used in a QSS selector changed"""
+    # polish() alone re-evaluates the style sheet rules; unpolish() first only
+    # throws away state that polish() rebuilds anyway
+    widget.style().polish(widget)
+
+
+def _status_index(raw_value):
+    """Index into _STATUSES for an LLM raw_value (thresholds are inclusive)"""
+    return bisect_left(_STATUS_THRESHOLDS, raw_value)
+
+
+@lru_cache(maxsize=256)
+def _clean_task_name(task):
+    """Task name reduced to a filename-safe form (spaces become underscores)"""
+    return _SANITIZE_RE.sub("", task).rstrip().replace(" ", "_")
+
+
+def _make_session_id(task):
+    """Build a session id from a task name and the current timestamp"""
+    return f"{_clean_task_name(task)[:30]}_{datetime.now():%Y%m%d_%H%M%S}"
+
+
+def _contains_hangul(text):
+    """Return True if text contains Hangul syllables (ASCII text short-circuits)"""
+    return not text.isascii() and _HANGUL_RE.search(text) is not None
+
+
+class _AppActivationObserver(NSObject):
+    """Forwards NSWorkspace app activation notifications to a Python callback"""
+
+    def initWithCallback_(self, callback):
+        self = objc.super(_AppActivationObserver, self).init()
+        if self is None:
+            return None
+        self._callback = callback
+        return self
+
+    def appActivated_(self, notification):
+        self._callback()
 
 
 class FocusReminderPopup(QDialog):
@@ -103,9 +268,7 @@ class FocusReminderPopup(QDialog):
     def init_ui(self):
         """Initialize the popup UI"""
         # Check if text is Korean or English
-        import re
-
-        is_korean = bool(re.search("[가-힣]", self.intention))
+        is_korean = _contains_hangul(self.intention)
 
         # Window settings
         self.setWindowTitle(get_text("focus_reminder_title"))
@@ -118,8 +281,6 @@ class FocusReminderPopup(QDialog):
         )
 
         # Center on screen
-        from PyQt6.QtWidgets import QApplication
-
         screen = QApplication.primaryScreen().geometry()
         self.move(
             (screen.width() - self.width()) // 2, (screen.height() - self.height()) // 2
@@ -245,8 +406,7 @@ class FocusReminderPopup(QDialog):
 
     def closeEvent(self, event):
         """Override close event to clean up timer"""
-        if hasattr(self, "auto_close_timer"):
-            self.auto_close_timer.stop()
+        self.auto_close_timer.stop()
         super().closeEvent(event)
 
     # Mouse drag handlers for moving the popup
@@ -258,9 +418,9 @@ class FocusReminderPopup(QDialog):
     def mouseMoveEvent(self, event):
         """Handle mouse movement to move window"""
         if self.oldPos:
-            delta = event.globalPosition().toPoint() - self.oldPos
-            self.move(self.pos() + delta)
-            self.oldPos = event.globalPosition().toPoint()
+            new_pos = event.globalPosition().toPoint()
+            self.move(self.pos() + new_pos - self.oldPos)
+            self.oldPos = new_pos
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to end window dragging"""
@@ -278,8 +438,6 @@ class SetIntentionReminderPopup(QDialog):
 
     def init_ui(self):
         """Initialize the popup UI"""
-        from ..config.constants import APP_MODE, APP_MODE_BASIC
-
         # Window settings
         self.setWindowTitle(get_text("set_intention_title"))
         self.setFixedSize(520, 320)
@@ -291,12 +449,7 @@ class SetIntentionReminderPopup(QDialog):
         )
 
         # Center on screen
-        from PyQt6.QtWidgets import QApplication
-
-        screen = QApplication.primaryScreen().geometry()
-        self.move(
-            (screen.width() - self.width()) // 2, (screen.height() - self.height()) // 2
-        )
+        self.center_on_screen()
 
         # Main layout
         layout = QVBoxLayout(self)
@@ -388,6 +541,13 @@ class SetIntentionReminderPopup(QDialog):
         """
         )
 
+    def center_on_screen(self):
+        """Center the popup on the primary screen"""
+        screen = QApplication.primaryScreen().geometry()
+        self.move(
+            (screen.width() - self.width()) // 2, (screen.height() - self.height()) // 2
+        )
+
     # Mouse drag handlers for moving the popup
     def mousePressEvent(self, event):
         """Handle mouse press to start window dragging"""
@@ -397,9 +557,9 @@ class SetIntentionReminderPopup(QDialog):
     def mouseMoveEvent(self, event):
         """Handle mouse movement to move window"""
         if self.oldPos:
-            delta = event.globalPosition().toPoint() - self.oldPos
-            self.move(self.pos() + delta)
-            self.oldPos = event.globalPosition().toPoint()
+            new_pos = event.globalPosition().toPoint()
+            self.move(self.pos() + new_pos - self.oldPos)
+            self.oldPos = new_pos
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to end window dragging"""
@@ -411,6 +571,8 @@ class Dashboard(QWidget):
     # Signals to notify app when capture starts/stops
     capture_started = pyqtSignal()
     capture_stopped = pyqtSignal()
+    level_changed = pyqtSignal(int, str, float)  # level, message, raw_value
+    frontmost_app_changed = pyqtSignal()  # Another app was activated (macOS)
     # play_sound_requested signal removed - sound functionality disabled
 
     def __init__(self, thread_manager, user_config, storage):
@@ -418,10 +580,24 @@ class Dashboard(QWidget):
         self.thread_manager = thread_manager
         self.user_config = user_config
         self.config = user_config  # Alias for compatibility
+        self.storage = storage  # The app's shared LocalStorage
 
         # Store clarification data in memory
         self.current_clarification_data = []
 
+        # Parsed clarification files by filename (None = no such file). The
+        # watcher drops the cache whenever the directory or a loaded file changes
+        self._clarification_file_cache = {}
+        self._clarification_watcher = QFileSystemWatcher(
+            [storage.get_clarification_data_dir()], self
+        )
+        self._clarification_watcher.directoryChanged.connect(
+            self._invalidate_clarification_cache
+        )
+        self._clarification_watcher.fileChanged.connect(
+            self._invalidate_clarification_cache
+        )
+
         # Flag for auto-starting after clarification completion
         self.auto_start_after_clarification = False
 
@@ -440,27 +616,66 @@ class Dashboard(QWidget):
         # App focus monitoring variables
         self.focus_monitoring_enabled = False
         self.last_frontmost_app = None
-        self.app_switch_time = None
-        self.focus_check_timer = QTimer()
-        self.focus_notification_timer = QTimer()
-        self.FOCUS_CHECK_INTERVAL = 2000  # Check every 2 seconds
+        self.focus_check_timer = QTimer(self)
+        self.focus_check_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.focus_notification_timer = self._make_single_shot(self._show_focus_popup)
+        # Set when the countdown starts; stays set after it fires so that hopping
+        # between other apps doesn't re-arm it until the intention app returns
+        self._focus_reminder_armed = False
+        # App switches arrive as NSWorkspace notifications; the timer is a watchdog
+        self.FOCUS_CHECK_INTERVAL = 5000
         self.NOTIFICATION_DELAY = (
             5000  # Show notification after 5 seconds (changed from 30)
         )
 
-        # Focus popup window
+        # Focus popup window and its companion notification texts
         self.focus_popup = None
+        self._load_focus_notification_texts()
+
+        # Feedback window questions (focused, ambiguous, distracted)
+        self._load_feedback_texts()
+
+        # Settings menu, built on first use
+        self._settings_menu = None
+        self._open_dialog_count = 0  # Settings dialogs currently in exec()
 
         # Cache current app name for focus monitoring
         self.current_intention_app_name = None
+        # Lowercased frontmost app name -> is it the intention app?
+        self._app_match_cache = {}
+        self._app_match_cache_owner = None  # Intention app name the cache is for
+        self._last_app_match = (None, False)  # (frontmost app, result) of last check
 
         # Current opacity setting for all windows
         self.current_opacity = 1.0  # Default 100% opacity
 
         # Connect focus monitoring signals
         self.focus_check_timer.timeout.connect(self._check_app_focus)
-        self.focus_notification_timer.timeout.connect(self._show_focus_popup)
-        self.focus_notification_timer.setSingleShot(True)
+        self.frontmost_app_changed.connect(self._on_frontmost_app_changed)
+        observer = _AppActivationObserver.alloc().initWithCallback_(
+            self.frontmost_app_changed.emit
+        )
+        notification_center = NSWorkspace.sharedWorkspace().notificationCenter()
+        notification_center.addObserver_selector_name_object_(
+            observer,
+            "appActivated:",
+            NSWorkspaceDidActivateApplicationNotification,
+            None,
+        )
+        self._app_activation_observer = observer
+
+        # Window drag: mouse moves are accumulated and applied once per frame
+        self._press_pos = None  # Left-button press position (drag candidate)
+        self.oldPos = None  # Set only while a left-button drag is in progress
+        self._pending_drag_delta = QPoint()
+        self._drag_flush_timer = self._make_single_shot(
+            self._flush_drag, DRAG_FLUSH_INTERVAL
+        )
+
+        # Opacity slider: ticks are collapsed and applied to windows once per frame
+        self._opacity_flush_timer = self._make_single_shot(
+            self._flush_opacity, OPACITY_FLUSH_INTERVAL
+        )
 
         # Initialize managers
         self.history_manager = HistoryManager()
@@ -499,6 +714,54 @@ class Dashboard(QWidget):
         self.is_processing_feedback = (
             False  # Flag to prevent session termination during feedback
         )
+        self.current_raw_value = 0.0  # raw_value of the displayed LLM response
+        self.last_ai_judgement = None  # Last AI judgement (level) for feedback
+        self.selected_feedback_type = None  # "good" / "bad" while giving feedback
+        self.current_level = None  # Level of the latest analysis result
+        self.current_message = ""  # Message of the latest analysis result
+
+        # Feedback window widgets (created by WindowManager, not in REMINDER mode)
+        self.feedback_window = None
+        self.feedback_container = None
+        self.feedback_question_label = None
+        self.good_feedback_button = None
+        self.bad_feedback_button = None
+        self.text_input_container = None
+        self.text_input_field = None
+
+        # Hide the feedback window shortly after the mouse leaves it
+        self.feedback_hide_timer = self._make_single_shot(self.hide_feedback_window)
+
+        # Auto-reset feedback processing if it never completes
+        self.feedback_timeout_timer = self._make_single_shot(
+            self._reset_feedback_timeout
+        )
+
+        # Read submitted feedback text once pending IME composition has finished
+        self._feedback_text_timer = self._make_single_shot(self._process_feedback_text)
+
+        # Close the feedback window shortly after feedback has been handled
+        self._feedback_close_timer = self._make_single_shot(self.hide_feedback_window)
+
+        # Follow new clarification messages unless the user scrolled up
+        self._chat_stick_to_bottom = True
+
+        # Start capture after clarification once the UI has caught up
+        self._auto_start_timer = self._make_single_shot(self.toggle_capture)
+
+        # NSWindow behind this widget, resolved once by makeWindowSecure
+        self._ns_window = None
+
+        # Short delay between stopping a session and showing the rating window
+        self._rating_delay_timer = self._make_single_shot(self.show_rating_window)
+
+        # Return to the input state once the rating window has been dismissed
+        self._rating_complete_timer = self._make_single_shot(self.on_rating_complete)
+        self._input_state_timer = self._make_single_shot(self.show_input_state)
+
+        # Reminder shown after the starting soon window (latest message wins)
+        self._pending_reminder_message = None
+        self._reminder_timer = self._make_single_shot(self._show_pending_reminder)
 
         # Learning from feedback
         self.current_reflection_intentions = []
@@ -515,25 +778,43 @@ class Dashboard(QWidget):
         self.current_rating = 0
         self.clarification_conversation = []
         self.is_capturing = False
-        self.history_timer = QTimer()
-        self.history_timer.timeout.connect(self.hide_history_window)
-        self.history_timer.setSingleShot(True)
+        self.history_timer = self._make_single_shot(self.hide_history_window)
 
         # IME state tracking for Korean input support
         self._ime_composition_active = False
         self._pending_task_set = False
 
         # Initialize loading animation timer
-        self.loading_timer = QTimer()
+        self.loading_timer = QTimer(self)
+        self.loading_timer.setTimerType(Qt.TimerType.PreciseTimer)  # Even dot cadence
+        self.loading_timer.setInterval(500)  # Update every 500ms
         self.loading_timer.timeout.connect(self.update_loading_animation)
         self.loading_dots = 0
         self.loading_message_widget = None
+        self._loading_text = ""  # get_text("loading"), refreshed on language change
+
+        # Widgets built conditionally by init_ui() or assigned by WindowManager
+        self.drag_bar = None
+        self.task_input = None
+        self.set_button = None
+        self.message_label = None
+        self.instruction_label = None
+        self.llm_response_window = None
+        self.llm_response_container = None
+        self.clarification_input = None
+        self.clarification_send_button = None
+        self.progress_bar = None
+        self.basic_title_label = None
+        self.history_title = None
+        self.starting_label = None
+        self.clarification_title = None
+        self.rating_title = None
 
         # Initialize UI
         self.init_ui()
 
-        # Install event filters on all widgets to catch clicks anywhere on dashboard
-        self._install_event_filters()
+        # App-wide click filter, installed only while the focus popup is showing
+        self._popup_filter_installed = False
 
         # Create all popup windows
         self.window_manager.create_all_windows()
@@ -577,8 +858,6 @@ class Dashboard(QWidget):
 
         # Get and cache current app name for focus monitoring
         if self.current_intention_app_name is None:
-            from ..utils.activity import get_current_app_name
-
             self.current_intention_app_name = get_current_app_name()
             print(
                 f"[FOCUS] Cached intention app name: '{self.current_intention_app_name}'"
@@ -587,8 +866,6 @@ class Dashboard(QWidget):
         # Enable monitoring even without current task
         self.focus_monitoring_enabled = True
 
-        from ..utils.activity import get_frontmost_app
-
         self.last_frontmost_app = get_frontmost_app()
         print(f"[FOCUS] Initial app: '{self.last_frontmost_app}'")
 
@@ -596,11 +873,16 @@ class Dashboard(QWidget):
         self.focus_check_timer.start(self.FOCUS_CHECK_INTERVAL)
         print("[FOCUS] Basic monitoring timer started")
 
-    def _is_korean_text(self, text):
-        """Check if text contains Korean characters"""
-        import re
-
-        return bool(re.search(r"[가-힣]", text))
+    def _ensure_session_id(self, task):
+        """Reuse the current session_id or generate one for the given task"""
+        if self.current_session_start_time:
+            logger.debug(
+                "Using existing session_id: %s", self.current_session_start_time
+            )
+        else:
+            self.current_session_start_time = _make_session_id(task)
+            logger.debug("Generated session_id: %s", self.current_session_start_time)
+        return self.current_session_start_time
 
     def init_ui(self):
         if APP_MODE == APP_MODE_FULL:
@@ -721,7 +1003,7 @@ class Dashboard(QWidget):
             self.quit_button = QPushButton("✕")
             self.quit_button.setObjectName("quitButton")
             self.quit_button.setFixedSize(QUIT_BUTTON_SIZE, QUIT_BUTTON_SIZE)
-            self.quit_button.clicked.connect(lambda: self.force_quit())
+            self.quit_button.clicked.connect(self.force_quit)
 
             # Create container for right side buttons
             buttons_container = QWidget()
@@ -790,6 +1072,7 @@ class Dashboard(QWidget):
             title_label.setObjectName("basicTitleLabel")
             title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             simplified_layout.addWidget(title_label, 1)  # Add stretch to center better
+            self.basic_title_label = title_label
 
             # Start button (prominent blue button) - same height as other buttons
             self.start_button = QPushButton(get_text("start_button"))
@@ -828,7 +1111,7 @@ class Dashboard(QWidget):
             self.quit_button.setFixedSize(
                 QUIT_BUTTON_SIZE, QUIT_BUTTON_SIZE
             )  # Increased size for better alignment
-            self.quit_button.clicked.connect(lambda: self.force_quit())
+            self.quit_button.clicked.connect(self.force_quit)
             buttons_layout.addWidget(self.quit_button)
 
             simplified_layout.addWidget(
@@ -842,98 +1125,8 @@ class Dashboard(QWidget):
 
         else:
             # 기존 UI: Full 모드 & Control 모드
-            # STATE 1: Task input state (initial state)
-            self.input_container = QWidget()  # Container for input state
-            input_layout = QHBoxLayout(self.input_container)  # Horizontal layout
-            input_layout.setContentsMargins(0, 0, 0, 0)  # No margins
-            input_layout.setSpacing(6)  # Space between elements
-
-            # Task input field
-            self.task_input = QTextEdit()
-            self.task_input.setPlaceholderText(TYPE_MESSAGE)  # Placeholder text
-            self.task_input.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
-            self.task_input.setWordWrapMode(
-                QTextOption.WrapMode.WordWrap
-            )  # Enable word wrap
-
-            # Ensure cursor is visible
-            self.task_input.setCursorWidth(2)  # Set cursor width
-            self.task_input.setTextInteractionFlags(
-                Qt.TextInteractionFlag.TextEditorInteraction
-            )
-
-            # Connect custom key event handler and mouse events
-            self.task_input.keyPressEvent = self.task_input_key_press
-
-            # Handle IME composition events for better Korean input support
-            self.task_input.inputMethodEvent = self.task_input_ime_event
-
-            # Additional IME support - ensure proper text handling
-            self.task_input.textChanged.connect(self._on_text_changed)
-
-            # Set button to confirm task
-            self.set_button = QPushButton(get_text("set_button"))  # Button to set task
-            self.set_button.clicked.connect(self.set_task)  # Click handler
-            self.set_button.setFixedWidth(BUTTON_WIDTH)  # Fixed button width
-            self.set_button.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
-
-            # Add widgets to input layout
-            input_layout.addWidget(self.task_input)
-            input_layout.addWidget(self.set_button)
-
-            # STATE 2: Task display state (after task is set)
-            self.task_container = QWidget()  # Container for task display state
-            task_layout = QVBoxLayout(self.task_container)  # Vertical layout
-            task_layout.setContentsMargins(0, 0, 0, 0)  # No margins
-            task_layout.setSpacing(8)  # Space between elements
-
-            # Task info container (task name and start/stop button)
-            task_info_container = QWidget()  # Container for task info
-            task_info_layout = QHBoxLayout(task_info_container)  # Horizontal layout
-            task_info_layout.setContentsMargins(0, 0, 0, 0)  # No margins
-            task_info_layout.setSpacing(6)  # Space between elements
-
-            # Task display field (replaces QLabel)
-            self.task_display = QTextEdit()
-            self.task_display.setObjectName("taskDisplay")
-            self.task_display.setReadOnly(False)
-            self.task_display.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-            self.task_display.setVerticalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAsNeeded
-            )
-            self.task_display.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            )
-            self.task_display.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
-            self.task_display.mousePressEvent = self.task_display_clicked
-
-            # Start/Stop button
-            self.start_button = QPushButton(
-                get_text("start_button")
-            )  # Start/stop button
-            self.start_button.setObjectName("startButton")
-            self.start_button.setCheckable(True)
-            self.start_button.clicked.connect(self.toggle_capture)
-            self.start_button.setFixedWidth(BUTTON_WIDTH)
-            self.start_button.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
-
-            # Add widgets in correct order
-            task_info_layout.addWidget(self.task_display)
-            task_info_layout.addWidget(self.start_button)
-
-            # Message label to show status/feedback
-            self.message_label = QLabel()  # Label for status messages
-            self.message_label.setObjectName("messageLabel")  # CSS selector name
-            self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center text
-            self.message_label.setWordWrap(True)  # Enable word wrapping
-            self.message_label.setSizePolicy(
-                QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum
-            )  # Size policy for dynamic height
-
-            # Add widgets to task layout
-            task_layout.addWidget(task_info_container)
-            task_layout.addWidget(self.message_label)
-            self.task_container.hide()  # Hide task container initially
+            self._build_input_container()
+            self._build_task_container()
 
             # Add both containers to main layout
             layout.addWidget(self.input_container)  # Add input container
@@ -999,6 +1192,17 @@ class Dashboard(QWidget):
                 color: white; 
             }
 
+            /* Darker look while a session is running (task display is read-only) */
+            QTextEdit#taskDisplay[readOnly="true"] {
+                background-color: #343434;
+            }
+
+            /* Greyed out while the rating window is up */
+            QTextEdit#taskDisplay:disabled {
+                background-color: #666666;
+                color: #999999;
+            }
+
             #dragBar {
                 background-color: rgba(30, 30, 30, 0.75);
                 color: white;  
@@ -1058,6 +1262,10 @@ class Dashboard(QWidget):
             #startButton:checked:hover {
                 background-color: #FF4F44;  /* Hover state when checked */
             }
+            #startButton:disabled {
+                background-color: #666666;  /* Greyed out while rating */
+                color: #999999;
+            }
             #messageLabel {
                 padding: 10px 12px;  /* Inner padding */
                 border-radius: 8px;  /* Rounded corners */
@@ -1114,6 +1322,10 @@ class Dashboard(QWidget):
             #compactStartButton:checked {
                 background-color: #FF3B30;
             }
+            #compactStartButton:disabled {
+                background-color: #666666;  /* Greyed out while rating */
+                color: #999999;
+            }
             #basicTitleLabel {
                 color: white;
                 font-size: 14px;
@@ -1157,16 +1369,109 @@ class Dashboard(QWidget):
         """
         )
 
+    def _build_input_container(self):
+        """Build the task input container (State 1: initial state)"""
+        self.input_container = QWidget()  # Container for input state
+        input_layout = QHBoxLayout(self.input_container)  # Horizontal layout
+        input_layout.setContentsMargins(0, 0, 0, 0)  # No margins
+        input_layout.setSpacing(6)  # Space between elements
+
+        # Task input field
+        self.task_input = QTextEdit()
+        self.task_input.setPlaceholderText(TYPE_MESSAGE)  # Placeholder text
+        self.task_input.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
+        self.task_input.setWordWrapMode(
+            QTextOption.WrapMode.WordWrap
+        )  # Enable word wrap
+
+        # Ensure cursor is visible
+        self.task_input.setCursorWidth(2)  # Set cursor width
+        self.task_input.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextEditorInteraction
+        )
+
+        # Connect custom key event handler and mouse events
+        self.task_input.keyPressEvent = self.task_input_key_press
+
+        # Handle IME composition events for better Korean input support
+        self.task_input.inputMethodEvent = self.task_input_ime_event
+
+        # Set button to confirm task
+        self.set_button = QPushButton(get_text("set_button"))  # Button to set task
+        self.set_button.clicked.connect(self.set_task)  # Click handler
+        self.set_button.setFixedWidth(BUTTON_WIDTH)  # Fixed button width
+        self.set_button.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
+
+        # Add widgets to input layout
+        input_layout.addWidget(self.task_input)
+        input_layout.addWidget(self.set_button)
+
+    def _build_task_container(self):
+        """Build the task display container (State 2: after task is set)"""
+        self.task_container = QWidget()  # Container for task display state
+        task_layout = QVBoxLayout(self.task_container)  # Vertical layout
+        task_layout.setContentsMargins(0, 0, 0, 0)  # No margins
+        task_layout.setSpacing(8)  # Space between elements
+
+        # Task info container (task name and start/stop button)
+        task_info_container = QWidget()  # Container for task info
+        task_info_layout = QHBoxLayout(task_info_container)  # Horizontal layout
+        task_info_layout.setContentsMargins(0, 0, 0, 0)  # No margins
+        task_info_layout.setSpacing(6)  # Space between elements
+
+        # Task display field (replaces QLabel)
+        self.task_display = QTextEdit()
+        self.task_display.setObjectName("taskDisplay")
+        self.task_display.setReadOnly(False)
+        self.task_display.setWordWrapMode(QTextOption.WrapMode.WordWrap)
+        self.task_display.setVerticalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAsNeeded
+        )
+        self.task_display.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self.task_display.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
+        self.task_display.mousePressEvent = self.task_display_clicked
+
+        # Start/Stop button
+        self.start_button = QPushButton(get_text("start_button"))  # Start/stop button
+        self.start_button.setObjectName("startButton")
+        self.start_button.setCheckable(True)
+        self.start_button.clicked.connect(self.toggle_capture)
+        self.start_button.setFixedWidth(BUTTON_WIDTH)
+        self.start_button.setFixedHeight(INPUT_HEIGHT)  # Use constant for height
+
+        # Add widgets in correct order
+        task_info_layout.addWidget(self.task_display)
+        task_info_layout.addWidget(self.start_button)
+
+        # Message label to show status/feedback
+        self.message_label = QLabel()  # Label for status messages
+        self.message_label.setObjectName("messageLabel")  # CSS selector name
+        self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center text
+        self.message_label.setWordWrap(True)  # Enable word wrapping
+        self.message_label.setSizePolicy(
+            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum
+        )  # Size policy for dynamic height
+
+        # Nothing re-shows the message label, so collapse it once here instead
+        # of on every state switch - the dashboard layout never shifts
+        self.message_label.setFixedHeight(0)
+        self.message_label.hide()
+
+        # Add widgets to task layout
+        task_layout.addWidget(task_info_container)
+        task_layout.addWidget(self.message_label)
+        self.task_container.hide()  # Hide task container initially
+
     def task_input_key_press(self, event):
         """Custom key handler for QTextEdit to allow Enter = set_task, Shift+Enter = new line"""
         # Prevent keyboard input if rating window is visible
         if self.is_rating_window_visible():
-            print("[DEBUG] Rating required before keyboard input")
+            logger.debug("Rating required before keyboard input")
             return
 
-        if event.key() == Qt.Key.Key_Return and not (
-            event.modifiers() & Qt.KeyboardModifier.ShiftModifier
-        ):
+        if event.key() == _KEY_RETURN and not (event.modifiers() & _SHIFT_MODIFIER):
             # Check if IME composition is in progress
             if self._ime_composition_active:
                 # IME composition is active, defer task setting
@@ -1174,54 +1479,51 @@ class Dashboard(QWidget):
                 QTextEdit.keyPressEvent(self.task_input, event)
                 return
 
-            # No IME composition active, safe to set task
-            # Small delay to ensure any final text processing is complete
-            QTimer.singleShot(50, self.set_task)
+            # No IME composition active, nothing to flush - set task right away
+            self.set_task()
         else:
             QTextEdit.keyPressEvent(self.task_input, event)
 
     def task_input_ime_event(self, event):
         """Handle IME composition events for better Korean input support"""
+        preedit = event.preeditString()
+        commit = event.commitString()
+
         # Check if composition is starting
-        if hasattr(event, "preeditString") and event.preeditString():
+        if preedit:
             self._ime_composition_active = True
 
         # Call the default implementation to handle composition
         QTextEdit.inputMethodEvent(self.task_input, event)
 
         # Store the composition state for better handling
-        if hasattr(event, "commitString") and event.commitString():
+        if commit:
             # Composition is complete, text has been committed
             self._ime_composition_active = False
-            # Force text update to ensure all characters are properly handled
-            QTimer.singleShot(50, lambda: self.task_input.update())
 
             # If there was a pending task set, execute it now
             if self._pending_task_set:
                 self._pending_task_set = False
                 QTimer.singleShot(100, self.set_task)
 
-    def _on_text_changed(self):
-        """Handle text changes to ensure IME composition is properly handled"""
-        # This method helps ensure Korean IME text is properly committed
-        # Reset IME composition state when text changes
-        if not self._ime_composition_active:
-            # Text changed but not due to IME composition
-            pass
+    def _check_credentials(self, action):
+        """Return True if user ID and password are set, otherwise ask for them"""
+        user_info = self.user_config.get_user_info()
+        if user_info.get("name") and user_info.get("password"):
+            return True
+
+        Dialogs.show_error(
+            "Credentials Required",
+            f"Please enter your assigned User ID and Password in Settings > User Settings before {action}.",
+        )
+        # Open user settings dialog automatically
+        self.open_user_settings()
+        return False
 
     def set_task(self):
         """Set the current task from the input field"""
         # Check if user ID and password are set before allowing task setting
-        user_info = self.user_config.get_user_info()
-        if not user_info or not user_info.get("name") or not user_info.get("password"):
-            from ..ui.dialogs import Dialogs
-
-            Dialogs.show_error(
-                "Credentials Required",
-                "Please enter your assigned User ID and Password in Settings > User Settings before setting a task.",
-            )
-            # Open user settings dialog automatically
-            self.open_user_settings()
+        if not self._check_credentials("setting a task"):
             return
 
         # Force any pending IME composition to complete
@@ -1237,42 +1539,23 @@ class Dashboard(QWidget):
         self._current_task = task
 
         # Generate session_id immediately when task is set
-        if not self.current_session_start_time:
-            from datetime import datetime
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            clean_task_name = "".join(
-                c for c in task if c.isalnum() or c in (" ", "-", "_")
-            ).rstrip()
-            clean_task_name = clean_task_name.replace(" ", "_")[:30]
-            self.current_session_start_time = f"{clean_task_name}_{timestamp}"
-            print(f"[DEBUG] Generated session_id: {self.current_session_start_time}")
-        else:
-            print(
-                f"[DEBUG] Using existing session_id: {self.current_session_start_time}"
-            )
+        self._ensure_session_id(task)
 
-        # Update task display
-        self.task_display.setText(task)
+        # Update task display (programmatic write - no textChanged dispatch)
+        with QSignalBlocker(self.task_display):
+            self.task_display.setText(task)
         self.start_button.setText(get_text("start_button"))
 
-        # Keep message label hidden to prevent layout changes
-        self.message_label.hide()
-        self.message_label.setVisible(False)
-        self.message_label.setMaximumHeight(0)
-        self.message_label.setMinimumHeight(0)
-
         # Switch to task state
         self.show_task_state()
 
         # Clear previous clarification data when setting new task
         self.current_clarification_data = []
-        if hasattr(self, "thread_manager"):
+        if self.thread_manager is not None:
             self.thread_manager.clear_clarification_data()
-        if hasattr(self, "llm_client") and hasattr(
-            self.llm_client, "clarification_manager"
-        ):
-            self.llm_client.clarification_manager.reset()
+        clarification_manager = getattr(self.llm_client, "clarification_manager", None)
+        if clarification_manager is not None:
+            clarification_manager.reset()
         print("[CLARIFICATION] Cleared previous clarification data for new task")
 
         # Show clarification window only for FULL mode, skip for BASIC and REMINDER modes
@@ -1283,13 +1566,14 @@ class Dashboard(QWidget):
         self.start_focus_monitoring()
 
         # Clear input field only after everything is set
-        self.task_input.clear()
+        with QSignalBlocker(self.task_input):
+            self.task_input.clear()
 
     def show_input_state(self):
         """Show input container (State 1) and hide task container."""
         # Prevent switching to input state if rating window is visible
         if self.is_rating_window_visible():
-            print("[DEBUG] Rating required before switching to input state")
+            logger.debug("Rating required before switching to input state")
             return
 
         # Stop focus monitoring when returning to input state
@@ -1297,90 +1581,73 @@ class Dashboard(QWidget):
 
         # Clear clarification data when returning to input state (user will set new intention)
         self.current_clarification_data = []
-        if hasattr(self, "thread_manager"):
+        if self.thread_manager is not None:
             self.thread_manager.clear_clarification_data()
-        if hasattr(self, "llm_client") and hasattr(
-            self.llm_client, "clarification_manager"
-        ):
-            self.llm_client.clarification_manager.reset()
+        clarification_manager = getattr(self.llm_client, "clarification_manager", None)
+        if clarification_manager is not None:
+            clarification_manager.reset()
         print(
             "[CLARIFICATION] Cleared clarification data when returning to input state"
         )
 
-        # Re-enable UI elements when switching to input state
-        if APP_MODE != APP_MODE_BASIC:
-            self.task_display.setEnabled(True)
-            self.task_display.setStyleSheet("")
-
-        self.input_container.show()
-        self.task_container.hide()
+        # Batch the widget mutations below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Re-enable UI elements when switching to input state
+            if APP_MODE != APP_MODE_BASIC:
+                self.task_display.setEnabled(True)
 
-        # Show history window when switching to input state (skip for BASIC mode)
-        if APP_MODE != APP_MODE_BASIC:
-            self.show_history_window()
+            self.input_container.show()
+            self.task_container.hide()
 
-        # Completely hide message label
-        self.message_label.hide()
-        self.message_label.setVisible(False)
-        self.message_label.setMaximumHeight(0)
-        self.message_label.setMinimumHeight(0)
+            # Show history window when switching to input state (skip for BASIC mode)
+            if APP_MODE != APP_MODE_BASIC:
+                self.show_history_window()
 
-        self.message_label.setText("")
-        self.message_label.setProperty("status", "")
+            self.message_label.setText("")
+            self.message_label.setProperty("status", "")
 
-        # Force layout update without changing window size
-        self.task_container.updateGeometry()
-        self.layout().activate()
+            # Force layout update without changing window size
+            self.task_container.updateGeometry()
+            self.layout().activate()
+        finally:
+            self.setUpdatesEnabled(True)
 
         self.task_input.setFocus()
 
     def show_task_state(self):
         """Show task container (State 2) and hide input container."""
-        self.input_container.hide()
-        self.task_container.show()
-
-        # Keep message label hidden to prevent layout changes
-        self.message_label.hide()
-        self.message_label.setVisible(False)
-        self.message_label.setMaximumHeight(0)
-        self.message_label.setMinimumHeight(0)
+        # Batch the widget mutations below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.input_container.hide()
+            self.task_container.show()
 
-        # Force layout update without changing window size
-        self.task_container.updateGeometry()
-        self.layout().activate()
+            # Force layout update without changing window size
+            self.task_container.updateGeometry()
+            self.layout().activate()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def toggle_capture(self):
         """Toggle capturing on/off"""
         # 🔥 CRITICAL: Reset feedback flag if user manually clicks stop button
         if self.is_processing_feedback and self.is_capturing:
-            print("[DEBUG] User clicked stop - force clearing feedback processing flag")
+            logger.debug("User clicked stop - force clearing feedback processing flag")
             self.is_processing_feedback = False
 
             # 🔥 CRITICAL: Reset ALL feedback states when stopping
             self._reset_all_feedback_states()
-            print("[DEBUG] All feedback states reset on stop")
+            logger.debug("All feedback states reset on stop")
 
         # Only block if trying to start during feedback processing (not stop)
         if self.is_processing_feedback and not self.is_capturing:
-            print("[DEBUG] BLOCKED: Cannot start capture during feedback processing")
+            logger.debug("BLOCKED: Cannot start capture during feedback processing")
             return
 
         # Check if user ID and password are set before allowing capture start
         if not self.is_capturing:  # Only check when starting capture
-            user_info = self.user_config.get_user_info()
-            if (
-                not user_info
-                or not user_info.get("name")
-                or not user_info.get("password")
-            ):
-                from ..ui.dialogs import Dialogs
-
-                Dialogs.show_error(
-                    "Credentials Required",
-                    "Please enter your assigned User ID and Password in Settings > User Settings before starting capture.",
-                )
-                # Open user settings dialog automatically
-                self.open_user_settings()
+            if not self._check_credentials("starting capture"):
                 return
 
         if APP_MODE == APP_MODE_BASIC:
@@ -1390,55 +1657,31 @@ class Dashboard(QWidget):
                 self._current_task = "Don't know"
 
                 # Generate session_id for baseline mode
-                if not self.current_session_start_time:
-                    from datetime import datetime
-
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    clean_task_name = "".join(
-                        c
-                        for c in self._current_task
-                        if c.isalnum() or c in (" ", "-", "_")
-                    ).rstrip()
-                    clean_task_name = clean_task_name.replace(" ", "_")[:30]
-                    self.current_session_start_time = f"{clean_task_name}_{timestamp}"
-                    print(
-                        f"[DEBUG] Generated session_id for baseline: {self.current_session_start_time}"
-                    )
-                else:
-                    print(
-                        f"[DEBUG] Using existing session_id: {self.current_session_start_time}"
-                    )
-
-                # Start intention session (skip history tracking for BASIC mode)
-                if APP_MODE != APP_MODE_BASIC:
-                    self.start_intention_session(self._current_task)
+                # (no intention session - history tracking is skipped in BASIC mode)
+                self._ensure_session_id(self._current_task)
 
                 # Change button state
                 self.start_button.setText(get_text("stop_button"))
                 self.start_button.setChecked(True)
 
                 # Change instruction message (only if instruction_label exists)
-                if hasattr(self, "instruction_label"):
+                if self.instruction_label is not None:
                     self.instruction_label.setText("Click 'Done' to finish activity ↑")
 
                 # Start recording signal
                 self.is_capturing = True
                 self.capture_started.emit()
             else:
-                # End intention session (skip history tracking for BASIC mode)
-                if APP_MODE != APP_MODE_BASIC:
-                    self.end_intention_session()
-
                 # Clear session start time
                 self.current_session_start_time = None
-                print("[DEBUG] Session ended, session start time cleared")
+                logger.debug("Session ended, session start time cleared")
 
                 # Change button state
                 self.start_button.setText("Start")
                 self.start_button.setChecked(False)
 
                 # Change instruction message (only if instruction_label exists)
-                if hasattr(self, "instruction_label"):
+                if self.instruction_label is not None:
                     self.instruction_label.setText("Click to start activity ↑")
 
                 # Stop recording signal
@@ -1451,33 +1694,20 @@ class Dashboard(QWidget):
             print("Error: No task set for capture")
             return
 
+        is_reminder = APP_MODE == APP_MODE_REMINDER
+
         if not self.is_capturing:
             # Start recording - hide clarification window, history window and show starting soon
             self.hide_clarification_window()
             self.hide_history_window()
 
             # Show starting soon window only for non-reminder modes
-            if APP_MODE != APP_MODE_REMINDER:
+            if not is_reminder:
                 self.show_starting_soon_window()
 
             # Use existing session_id (already generated when task was set)
-            if not self.current_session_start_time:
-                # Fallback: generate session_id if not already created
-                from datetime import datetime
-
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                clean_task_name = "".join(
-                    c for c in self._current_task if c.isalnum() or c in (" ", "-", "_")
-                ).rstrip()
-                clean_task_name = clean_task_name.replace(" ", "_")[:30]
-                self.current_session_start_time = f"{clean_task_name}_{timestamp}"
-                print(
-                    f"[DEBUG] Fallback: Generated session_id: {self.current_session_start_time}"
-                )
-            else:
-                print(
-                    f"[DEBUG] Using existing session_id: {self.current_session_start_time}"
-                )
+            # Fallback: generate session_id if not already created
+            self._ensure_session_id(self._current_task)
 
             # Handle clarification data
             if self.current_clarification_data:
@@ -1500,18 +1730,17 @@ class Dashboard(QWidget):
                 )
                 pass
 
-            # Start intention session (skip history tracking for BASIC mode)
-            if APP_MODE != APP_MODE_BASIC:
-                self.start_intention_session(self._current_task)
+            # Start intention session
+            self.start_intention_session(self._current_task)
 
             self.start_button.setText(get_text("stop_button"))
             self.is_capturing = True
             self.capture_started.emit()
 
             # Update to "set/started" state with message
-            if APP_MODE == APP_MODE_REMINDER:
+            if is_reminder:
                 # In reminder mode, show starting soon first, then replace with reminder message
-                if self._is_korean_text(self.current_task):
+                if _contains_hangul(self.current_task):
                     # 한글이 포함된 경우
                     encouragement_message = get_text(
                         "encouragement_korean", task=self.current_task
@@ -1523,22 +1752,19 @@ class Dashboard(QWidget):
                     )
 
                 # Show reminder message after starting soon window
-                QTimer.singleShot(
-                    1000, lambda: self._show_reminder_message(encouragement_message)
-                )
+                self._pending_reminder_message = encouragement_message
+                self._reminder_timer.start(1000)
             else:
                 # General mode
                 self.message_label.setText(CLICK_MESSAGE)
 
             self.task_display.setReadOnly(True)
-            self.task_display.setStyleSheet(
-                "background-color: #343434; color: white; border-radius: 8px;"
-            )
+            _repolish(self.task_display)
         else:
             # Check if feedback is being processed - warn but still allow session termination
             if self.is_processing_feedback:
-                print(
-                    "[DEBUG] Feedback processing in progress - force stopping session anyway"
+                logger.debug(
+                    "Feedback processing in progress - force stopping session anyway"
                 )
                 # Force clear feedback processing flag
                 self.is_processing_feedback = False
@@ -1553,7 +1779,7 @@ class Dashboard(QWidget):
             self.thread_manager.clear_reflection_rule()
 
             # End intention session (skip history tracking for BASIC mode)
-            print("[DEBUG] MANUAL SESSION TERMINATION: User clicked stop button")
+            logger.debug("MANUAL SESSION TERMINATION: User clicked stop button")
             # DON'T end session here - keep it active for rating
             # Session will be ended in set_rating() after rating is provided
             # if APP_MODE != APP_MODE_BASIC:
@@ -1561,14 +1787,14 @@ class Dashboard(QWidget):
 
             # DON'T clear session start time yet - need it for rating
             # self.current_session_start_time will be cleared in on_rating_complete
-            print(
-                f"[DEBUG] Session stopping, keeping session active for rating: {self.current_session_start_time}"
+            logger.debug(
+                "Session stopping, keeping session active for rating: %s",
+                self.current_session_start_time,
             )
 
             # Show rating window directly without switching to input state
-            QTimer.singleShot(
-                100, self.show_rating_window
-            )  # Small delay to ensure proper state
+            # Small delay to ensure proper state
+            self._rating_delay_timer.start(100)
 
             # Change button text and state after rating window is shown
             self.is_capturing = False
@@ -1578,9 +1804,8 @@ class Dashboard(QWidget):
             self.message_label.setProperty("status", "waiting")
             self.message_label.setText(CLICK_MESSAGE)
             self.task_display.setReadOnly(False)
-            self.task_display.setStyleSheet("color: white;")
-            self.message_label.style().unpolish(self.message_label)
-            self.message_label.style().polish(self.message_label)
+            _repolish(self.task_display)
+            _repolish(self.message_label)
 
         # Always update the checked state of the button
         # self.start_button.setChecked(self.is_capturing)  # Moved to on_rating_complete
@@ -1593,20 +1818,26 @@ class Dashboard(QWidget):
 
         # Skip updating if session is no longer active
         if not self.is_capturing:
-            print(f"[DEBUG] Ignoring analysis result - session is stopped")
+            logger.debug("Ignoring analysis result - session is stopped")
             return
 
         # Store AI judgment for feedback system
         self.last_ai_judgement = level
-        print(
-            f"[DASHBOARD] AI judgment stored: {level} ({'focused' if level == 0 else 'distracted'})"
+        logger.debug(
+            "[DASHBOARD] AI judgment stored: %s (%s)",
+            level,
+            "focused" if level == 0 else "distracted",
         )
 
-        # Check if this is a state change and request sound playback
-        previous_level = getattr(self, "current_level", None)
-        if previous_level is None or previous_level != level:
-            print(f"[DASHBOARD] State change detected: {previous_level} -> {level}")
-            # Sound request removed - sound functionality disabled
+        # Store level and message, announcing only actual state changes
+        previous_level = self.current_level
+        self.current_level = level
+        self.current_message = message
+        if previous_level != level:
+            logger.debug(
+                "[DASHBOARD] State change detected: %s -> %s", previous_level, level
+            )
+            self.level_changed.emit(level, message, raw_value)
 
         # Track focus/distracted messages in history manager (skip for BASIC mode)
         # REMOVED: Now using rating system instead of automatic count tracking
@@ -1627,18 +1858,11 @@ class Dashboard(QWidget):
             # In reminder mode, receive server response but don't show UI updates
             # Only store data for potential rating/feedback purposes
             if self.is_capturing:
-                self.current_level = level
-                self.current_message = message
-
                 # Show LLM response window with appropriate color
                 self.show_llm_response_window(message, raw_value)
             return
 
         # 기존 Full 모드 로직
-        # Store level and message
-        self.current_level = level
-        self.current_message = message
-
         # Only process if we're in task display state and capturing
         if self.task_container.isVisible() and self.is_capturing:
             # Show LLM response window with appropriate color
@@ -1648,63 +1872,83 @@ class Dashboard(QWidget):
     def drag_bar_mouse_press(self, event):
         """Handle mouse press on drag bar to start window dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.oldPos = event.globalPosition().toPoint()  # Store position
+            self._press_pos = event.globalPosition().toPoint()  # Store position
 
     def drag_bar_mouse_move(self, event):
         """Handle mouse movement on drag bar to move window"""
-        if hasattr(self, "oldPos") and self.oldPos:
-            delta = event.globalPosition().toPoint() - self.oldPos  # Calculate movement
-            self.move(self.pos() + delta)  # Move window
-            self.oldPos = event.globalPosition().toPoint()  # Update position
-
-            # Update all popup window positions through WindowManager
-            self.window_manager.update_all_window_positions()
+        self._drag_move(event.globalPosition().toPoint())
 
     def drag_bar_mouse_release(self, event):
         """Handle mouse release on drag bar to end window dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.oldPos = None  # Reset position
+            self._end_drag()
+
+    def _drag_move(self, global_pos):
+        """Start dragging once the cursor leaves the press radius, then queue moves"""
+        if self.oldPos is None:
+            if self._press_pos is None:
+                return
+            # Hysteresis: ignore click jitter within DRAG_START_DISTANCE pixels
+            offset = global_pos - self._press_pos
+            if offset.x() ** 2 + offset.y() ** 2 <= DRAG_START_DISTANCE**2:
+                return
+            self.oldPos = self._press_pos
+        self._queue_drag(global_pos)
+
+    def _end_drag(self):
+        """Finish a drag (or plain click) and apply any pending movement"""
+        self._press_pos = None
+        self.oldPos = None
+        self._flush_drag()
+
+    def _queue_drag(self, global_pos):
+        """Accumulate drag movement and schedule a single flush for this frame"""
+        self._pending_drag_delta += global_pos - self.oldPos
+        self.oldPos = global_pos
+        if not self._drag_flush_timer.isActive():
+            self._drag_flush_timer.start()
+
+    def _flush_drag(self):
+        """Move the dashboard and its popup windows by the accumulated delta"""
+        self._drag_flush_timer.stop()
+        delta = self._pending_drag_delta
+        if delta.isNull():
+            return
+        self._pending_drag_delta = QPoint()
+        self.move(self.pos() + delta)
+
+        # Update all popup window positions through WindowManager
+        self.window_manager.update_all_window_positions()
 
     # Dashboard mouse handlers - Allow dragging from dashboard
     def mousePressEvent(self, event):
         """Handle mouse press for dashboard interactions and dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            # Start dragging
-            self.oldPos = event.globalPosition().toPoint()
+            # Drag starts only after the cursor moves past the hysteresis radius
+            self._press_pos = event.globalPosition().toPoint()
 
             # Close focus popup if visible when dashboard is clicked
             self._close_focus_popup_on_dashboard_click()
 
     def mouseMoveEvent(self, event):
         """Handle mouse movement - allow dragging from dashboard"""
-        if hasattr(self, "oldPos") and self.oldPos:
-            delta = event.globalPosition().toPoint() - self.oldPos
-            self.move(self.pos() + delta)
-            self.oldPos = event.globalPosition().toPoint()
-
-            # Update all popup window positions through WindowManager
-            self.window_manager.update_all_window_positions()
+        self._drag_move(event.globalPosition().toPoint())
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release - end dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.oldPos = None
+            self._end_drag()
 
     def setup_window_level(self):
         """Setup window level for macOS - Keep window above others"""
         if sys.platform == "darwin":
-            try:
-                from AppKit import NSApp, NSFloatingWindowLevel
-
-                self.show()
-                windows = NSApp.windows()
-                if windows:
-                    windows[-1].setLevel_(NSFloatingWindowLevel)  # Set floating level
+            self.show()
+            windows = NSApp.windows()
+            if windows:
+                windows[-1].setLevel_(NSFloatingWindowLevel)  # Set floating level
 
-                # 창이 실제로 보여진 후 보안 설정 적용
-                self.makeWindowSecure()
-            except ImportError:
-                self.show()
+            # 창이 실제로 보여진 후 보안 설정 적용
+            self.makeWindowSecure()
         else:
             self.show()
 
@@ -1713,9 +1957,10 @@ class Dashboard(QWidget):
         if sys.platform == "darwin" and EXCLUDE_FROM_SCREEN_CAPTURE:
             try:
                 # Main window security
-                native_view = objc.objc_object(c_void_p=int(self.winId()))
-                ns_window = native_view.window()
-                ns_window.setSharingType_(NSWindowSharingNone)
+                if self._ns_window is None:
+                    native_view = objc.objc_object(c_void_p=int(self.winId()))
+                    self._ns_window = native_view.window()
+                self._ns_window.setSharingType_(NSWindowSharingNone)
                 print("[DASHBOARD] Screen capture protection enabled")
 
                 # All popup windows security is handled by WindowManager
@@ -1756,34 +2001,15 @@ class Dashboard(QWidget):
         return clarification_window and clarification_window.isVisible()
 
     def is_settings_dialog_visible(self):
-        """Check if any settings dialog is visible"""
-        # Check for various settings dialogs
-        settings_dialogs = [
-            "user_settings_dialog",
-            "language_settings_dialog",
-            "settings_dialog",
-        ]
-
-        for dialog_attr in settings_dialogs:
-            if hasattr(self, dialog_attr):
-                dialog = getattr(self, dialog_attr)
-                if dialog and hasattr(dialog, "isVisible") and dialog.isVisible():
-                    return True
-
-        # Also check for any visible QDialog children
-        from PyQt6.QtWidgets import QDialog
-
-        for child in self.findChildren(QDialog):
-            if child.isVisible():
-                return True
-
-        return False
+        """Check if any settings dialog is open"""
+        # Settings dialogs are modal and counted around their exec() calls
+        return self._open_dialog_count > 0
 
     def task_display_clicked(self, event):
         """Handle task display click to allow editing"""
         # Prevent interaction if rating window is visible
         if self.is_rating_window_visible():
-            print("[DEBUG] Rating required before proceeding")
+            logger.debug("Rating required before proceeding")
             return
 
         if not self.start_button.isChecked():  # Only allow editing when not running
@@ -1794,54 +2020,42 @@ class Dashboard(QWidget):
 
     def show_settings_menu(self):
         """Show settings menu with various options"""
-        from PyQt6.QtWidgets import QMenu
+        # Build the menu once and reuse it (labels refreshed on language change)
+        if self._settings_menu is None:
+            menu = QMenu(self)
+            menu.setStyleSheet(_SETTINGS_MENU_QSS)
 
-        # Create context menu
-        menu = QMenu(self)
-        menu.setStyleSheet(
-            """
-            QMenu {
-                background-color: #2D2D2D;
-                border: 1px solid #555555;
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QMenu::item {
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #007AFF;
-            }
-        """
-        )
+            # Add menu items
+            user_settings_action = menu.addAction(get_text("user_settings"))
+            user_settings_action.setData("user_settings")
+            user_settings_action.triggered.connect(self.open_user_settings)
 
-        # Add menu items
-        user_settings_action = menu.addAction(get_text("user_settings"))
-        user_settings_action.triggered.connect(self.open_user_settings)
+            # Add language settings
+            language_settings_action = menu.addAction(get_text("language_settings"))
+            language_settings_action.setData("language_settings")
+            language_settings_action.triggered.connect(self.open_language_settings)
 
-        # Add language settings
-        language_settings_action = menu.addAction(get_text("language_settings"))
-        language_settings_action.triggered.connect(self.open_language_settings)
+            # Sound Settings removed - sound functionality disabled
+            # Display Settings removed - single display auto-selection
 
-        # Sound Settings removed - sound functionality disabled
-        # Display Settings removed - single display auto-selection
+            self._settings_menu = menu
 
         # Show menu at settings button position
         button_pos = self.settings_button.mapToGlobal(
             self.settings_button.rect().bottomLeft()
         )
-        menu.exec(button_pos)
+        self._settings_menu.exec(button_pos)
 
     def open_user_settings(self):
         """Open user settings dialog"""
         try:
-            from ..ui.settings_dialog import UserSettingsDialog
-            from PyQt6.QtWidgets import QDialog
-
             self.user_settings_dialog = UserSettingsDialog(self.config.get_user_info())
-            if self.user_settings_dialog.exec() == QDialog.DialogCode.Accepted:
+            self._open_dialog_count += 1
+            try:
+                result = self.user_settings_dialog.exec()
+            finally:
+                self._open_dialog_count -= 1
+            if result == QDialog.DialogCode.Accepted:
                 user_input = self.user_settings_dialog.get_user_input()
                 name, password, device = (
                     user_input["name"],
@@ -1863,9 +2077,6 @@ class Dashboard(QWidget):
     def open_language_settings(self):
         """Open language settings dialog from dashboard"""
         try:
-            from ..ui.settings_dialog import LanguageSettingsDialog
-            from PyQt6.QtWidgets import QDialog
-
             self.language_settings_dialog = LanguageSettingsDialog(self)
 
             # Connect language change signal
@@ -1873,7 +2084,11 @@ class Dashboard(QWidget):
                 self._on_language_changed
             )
 
-            self.language_settings_dialog.exec()
+            self._open_dialog_count += 1
+            try:
+                self.language_settings_dialog.exec()
+            finally:
+                self._open_dialog_count -= 1
             # Clear reference after dialog closes
             self.language_settings_dialog = None
         except Exception as e:
@@ -1934,8 +2149,7 @@ class Dashboard(QWidget):
         except Exception as e:
             print(f"[ERROR] Failed to load today's history: {e}")
             # Ensure timeline is cleared even if there's an error
-            if hasattr(self, "history_timeline"):
-                self.history_timeline.clear_items()
+            self.history_timeline.clear_items()
             # Still try to update rating display
             try:
                 self.update_rating_display()
@@ -1949,7 +2163,7 @@ class Dashboard(QWidget):
 
     def start_intention_session(self, intention):
         """Start a new intention session"""
-        session_id = getattr(self, "current_session_start_time", None)
+        session_id = self.current_session_start_time
         return self.history_manager.start_intention_session(intention, session_id)
 
     def end_intention_session(self):
@@ -1975,11 +2189,7 @@ class Dashboard(QWidget):
         """Show history window with animation (skip for BASIC mode)"""
         if APP_MODE != APP_MODE_BASIC:
             # Hide other windows that should not be visible with history
-            self.hide_clarification_window()
-            self.hide_llm_response_window()
-            self.hide_starting_soon_window()
-
-            self.window_manager.show_window_with_animation("history")
+            self.window_manager.show_exclusive("history")
 
     def hide_history_window(self):
         """Hide history window with animation (skip for BASIC mode)"""
@@ -1997,12 +2207,11 @@ class Dashboard(QWidget):
 
         # Clear previous clarification data when starting new clarification
         self.current_clarification_data = []
-        if hasattr(self, "thread_manager"):
+        if self.thread_manager is not None:
             self.thread_manager.clear_clarification_data()
-        if hasattr(self, "llm_client") and hasattr(
-            self.llm_client, "clarification_manager"
-        ):
-            self.llm_client.clarification_manager.reset()
+        clarification_manager = getattr(self.llm_client, "clarification_manager", None)
+        if clarification_manager is not None:
+            clarification_manager.reset()
         print(
             "[CLARIFICATION] Cleared previous clarification data for new clarification"
         )
@@ -2023,11 +2232,7 @@ class Dashboard(QWidget):
     def show_starting_soon_window(self):
         """Show starting soon window"""
         # Hide other windows that should not be visible with starting soon
-        self.hide_history_window()
-        self.hide_clarification_window()
-        self.hide_llm_response_window()
-
-        self.window_manager.show_window("starting_soon")
+        self.window_manager.show_exclusive("starting_soon")
 
     def hide_starting_soon_window(self):
         """Hide starting soon window"""
@@ -2040,47 +2245,34 @@ class Dashboard(QWidget):
     def show_llm_response_window(self, message, raw_value=0.0):
         """Show LLM response window with message"""
 
-        # Hide other windows that should not be visible with LLM response
-        self.hide_starting_soon_window()
-        self.hide_history_window()
-        self.hide_clarification_window()
-
         # Store raw_value for feedback message determination
         self.current_raw_value = raw_value
 
         # 🔥 CRITICAL: Store currently displayed message info for accurate feedback
         self.displayed_message_image_id = self.last_llm_response_image_id
         self.displayed_message_response = self.last_llm_response
-        self.displayed_message_timestamp = time.time()
+        self.displayed_message_timestamp = time.monotonic()
 
-        print(
-            f"[FEEDBACK_TARGET] Message displayed - Image ID: {self.displayed_message_image_id}"
-        )
-        print(
-            f"[FEEDBACK_TARGET] This will be the target for any feedback given on this message"
+        logger.debug(
+            "[FEEDBACK_TARGET] Message displayed - Image ID: %s",
+            self.displayed_message_image_id,
         )
 
-        if raw_value <= 0.2:
-            status = "focused"
-        elif raw_value <= 0.6:  # Back to 0.6 as requested
-            status = "ambiguous"
-        else:
-            status = "distracted"
+        status = _STATUSES[_status_index(raw_value)]
 
-        print(f"[UI] LLM response window with status: {status}")
+        logger.debug("[UI] LLM response window with status: %s", status)
         self.llm_response_label.setText(message)
 
         # Adjust window height based on message length
         self.window_manager.adjust_llm_response_window_height(message)
 
         # Set status-based styling
-        container = self.llm_response_window.findChild(QWidget, "llmContainer")
-        if container:
-            container.setProperty("status", status)
-            container.style().unpolish(container)
-            container.style().polish(container)
+        container = self.llm_response_container
+        container.setProperty("status", status)
+        _repolish(container)
 
-        self.window_manager.show_window("llm_response")
+        # Hide other windows that should not be visible with LLM response
+        self.window_manager.show_exclusive("llm_response")
 
         # Remove automatic feedback window display
         # Feedback window will only show on mouse hover
@@ -2092,40 +2284,55 @@ class Dashboard(QWidget):
             return
 
         # Cancel any pending hide timer
-        if hasattr(self, "feedback_hide_timer") and self.feedback_hide_timer.isActive():
+        if self.feedback_hide_timer.isActive():
             self.feedback_hide_timer.stop()
 
+        self._ensure_feedback_window()
+
         # Update feedback message based on current raw value
         self._update_feedback_message()
 
         # Show feedback window immediately
         self.window_manager.show_window_with_animation("feedback")
 
-    def _update_feedback_message(self):
-        """Update feedback message based on current raw value"""
-        if not hasattr(self, "current_raw_value"):
+    def _ensure_feedback_window(self):
+        """Build the feedback window the first time it is needed"""
+        if self.feedback_window is not None:
             return
+        self.window_manager.create_feedback_window()
+        self.window_manager.make_windows_secure(
+            EXCLUDE_FROM_SCREEN_CAPTURE, window_names=["feedback"]
+        )
 
+    def _load_feedback_texts(self):
+        """Resolve the feedback questions for the current language"""
+        self._feedback_texts = (
+            get_text("feedback_focused"),
+            get_text("feedback_ambiguous"),
+            get_text("feedback_distracted"),
+        )
+
+    def _load_focus_notification_texts(self):
+        """Resolve the focus reminder notification texts for the current language"""
+        self._focus_notification_texts = {
+            "title": get_text("focus_notification_title"),
+            "subtitle": get_text("focus_notification_subtitle"),
+            "message": get_text("focus_notification_message"),
+        }
+
+    def _update_feedback_message(self):
+        """Update feedback message based on current raw value"""
         # Determine feedback message based on raw_value
-        if self.current_raw_value <= 0.2:
-            feedback_message = get_text("feedback_focused")
-        elif self.current_raw_value <= 0.6:
-            feedback_message = get_text("feedback_ambiguous")
-        else:  # 0.7 - 1.0
-            feedback_message = get_text("feedback_distracted")
-
-        # Find and update the feedback window message label
-        feedback_window = self.window_manager.windows.get("feedback")
-        if feedback_window:
-            # Look for the question label in the feedback window
-            message_label = feedback_window.findChild(QLabel, "questionLabel")
-            if message_label:
-                message_label.setText(feedback_message)
-                print(
-                    f"[FEEDBACK] Updated message: '{feedback_message}' (score: {self.current_raw_value:.1f})"
-                )
-            else:
-                print(f"[FEEDBACK] Question label not found in feedback window")
+        feedback_message = self._feedback_texts[_status_index(self.current_raw_value)]
+
+        # Update the feedback window question label
+        if self.feedback_question_label is not None:
+            self.feedback_question_label.setText(feedback_message)
+            logger.debug(
+                "[FEEDBACK] Updated message: '%s' (score: %.1f)",
+                feedback_message,
+                self.current_raw_value,
+            )
 
     def llm_response_leave_event(self, event):
         """Hide feedback window when mouse leaves LLM response window"""
@@ -2134,27 +2341,17 @@ class Dashboard(QWidget):
             return
 
         # Start timer to hide feedback window after short delay
-        if not hasattr(self, "feedback_hide_timer"):
-            self.feedback_hide_timer = QTimer()
-            self.feedback_hide_timer.setSingleShot(True)
-            self.feedback_hide_timer.timeout.connect(self.hide_feedback_window)
-
         self.feedback_hide_timer.start(300)  # 300ms delay before hiding
 
     def feedback_window_enter_event(self, event):
         """Keep feedback window visible when mouse enters"""
         # Cancel any pending hide timer
-        if hasattr(self, "feedback_hide_timer") and self.feedback_hide_timer.isActive():
+        if self.feedback_hide_timer.isActive():
             self.feedback_hide_timer.stop()
 
     def feedback_window_leave_event(self, event):
         """Hide feedback window when mouse leaves with a small delay"""
         # Start timer to hide feedback window after short delay
-        if not hasattr(self, "feedback_hide_timer"):
-            self.feedback_hide_timer = QTimer()
-            self.feedback_hide_timer.setSingleShot(True)
-            self.feedback_hide_timer.timeout.connect(self.hide_feedback_window)
-
         self.feedback_hide_timer.start(300)  # 300ms delay before hiding
 
     def show_feedback_window_with_delay(self):
@@ -2166,19 +2363,14 @@ class Dashboard(QWidget):
         """Hide feedback window with animation"""
         # 🔥 CRITICAL: Reset ALL feedback states when hiding feedback window
         if self.is_processing_feedback:
-            print("[DEBUG] Feedback window closed - resetting ALL feedback states")
+            logger.debug("Feedback window closed - resetting ALL feedback states")
             self._reset_all_feedback_states()
         else:
             # Even if not processing, still clean up UI states
             try:
-                self.reset_feedback_buttons()
-                if hasattr(self, "text_input_container"):
-                    self.text_input_container.hide()
-                if hasattr(self, "shrink_feedback_window"):
-                    self.shrink_feedback_window()
-                if hasattr(self, "selected_feedback_type"):
-                    self.selected_feedback_type = None
-                print("[DEBUG] Feedback UI states cleaned up")
+                self._reset_feedback_widgets()
+                self.selected_feedback_type = None
+                logger.debug("Feedback UI states cleaned up")
             except Exception as e:
                 print(f"[DEBUG] Error cleaning feedback UI states: {e}")
 
@@ -2191,199 +2383,151 @@ class Dashboard(QWidget):
             return
 
         # Stop any hide timers
-        if hasattr(self, "feedback_hide_timer") and self.feedback_hide_timer:
-            self.feedback_hide_timer.stop()
+        self.feedback_hide_timer.stop()
 
         # Set feedback processing flag to prevent session termination
         self.is_processing_feedback = True
 
-        # 🔥 SAFE: Set timeout with safe exception handling
-        try:
-            if not hasattr(self, "feedback_timeout_timer"):
-                self.feedback_timeout_timer = QTimer()
-                self.feedback_timeout_timer.setSingleShot(True)
-                self.feedback_timeout_timer.timeout.connect(
-                    self._reset_feedback_timeout
-                )
-
-            # Start 30-second timeout (reduced from 60s to minimize crash window)
-            if hasattr(self.feedback_timeout_timer, "start"):
-                self.feedback_timeout_timer.start(30000)  # 30 seconds
-                print(
-                    "[DEBUG] Feedback timeout started (30s) - auto-reset if not completed"
-                )
-        except Exception as e:
-            print(f"[DEBUG] Error setting feedback timeout: {e}")
-            # Continue without timeout if timer setup fails
+        # Start 30-second timeout (reduced from 60s to minimize crash window)
+        self.feedback_timeout_timer.start(30000)  # 30 seconds
+        logger.debug("Feedback timeout started (30s)")
 
         # Store the selected feedback type for later submission
         self.selected_feedback_type = feedback_type
 
         # Determine the feedback case based on AI judgment and user feedback
-        if hasattr(self, "last_ai_judgement"):
-            ai_judgement_text = (
-                "distracted" if self.last_ai_judgement == 1 else "focused"
-            )
-            print(
-                f"[FEEDBACK] AI judgment: {self.last_ai_judgement} ({ai_judgement_text})"
+        if self.last_ai_judgement is not None:
+            logger.debug(
+                "[FEEDBACK] AI judgment: %s (%s), user feedback: %s",
+                self.last_ai_judgement,
+                "distracted" if self.last_ai_judgement == 1 else "focused",
+                feedback_type,
             )
-            print(f"[FEEDBACK] User feedback: {feedback_type}")
         else:
-            print(f"[FEEDBACK] Warning: No AI judgment stored")
+            logger.debug("[FEEDBACK] Warning: No AI judgment stored")
 
         # Simple visual feedback - change button border
         self.highlight_feedback_button(button, feedback_type)
 
         # Show text input area and expand window
-        if hasattr(self, "text_input_container"):
+        if self.text_input_container is not None:
             self.text_input_container.show()
             # Expand feedback window to accommodate text input
             self.expand_feedback_window()
-            # Clear previous text and focus on input field
-            if hasattr(self, "text_input_field"):
-                self.text_input_field.clear()
-                self.text_input_field.setFocus()
+            # Clear and focus the input once the resize has been processed
+            QTimer.singleShot(
+                0, Qt.TimerType.CoarseTimer, self._focus_feedback_text_input
+            )
+
+    def _focus_feedback_text_input(self):
+        """Clear previous text and focus on the feedback input field"""
+        if self.text_input_field is not None:
+            self.text_input_field.clear()
+            self.text_input_field.setFocus()
 
     def expand_feedback_window(self):
         """Expand feedback window to accommodate text input"""
-        if hasattr(self, "feedback_window"):
-            # Expand to larger size (reduced height since no skip button)
-            self.feedback_window.setFixedSize(400, 200)
-            # Update container geometry
-            container = self.feedback_window.findChild(QWidget, "feedbackContainer")
-            if container:
-                container.setGeometry(0, 0, 400, 200)
+        # Larger size (reduced height since no skip button)
+        self._resize_feedback_window(200)
 
     def shrink_feedback_window(self):
         """Shrink feedback window back to button-only size"""
-        if hasattr(self, "feedback_window"):
-            # Shrink to original size
-            self.feedback_window.setFixedSize(400, 90)
-            # Update container geometry
-            container = self.feedback_window.findChild(QWidget, "feedbackContainer")
-            if container:
-                container.setGeometry(0, 0, 400, 90)
+        self._resize_feedback_window(90)
+
+    def _resize_feedback_window(self, height):
+        """Resize the feedback window and its container with a single repaint"""
+        if self.feedback_window is None:
+            return
+        self.feedback_window.setUpdatesEnabled(False)
+        try:
+            self.feedback_window.setFixedSize(400, height)
+            self.feedback_container.setGeometry(0, 0, 400, height)
+        finally:
+            self.feedback_window.setUpdatesEnabled(True)
 
     def highlight_feedback_button(self, button, feedback_type):
         """Highlight clicked feedback button with border color"""
         # Reset both buttons to default style first
-        if hasattr(self, "good_feedback_button"):
-            self.good_feedback_button.setStyleSheet("")
-        if hasattr(self, "bad_feedback_button"):
-            self.bad_feedback_button.setStyleSheet("")
-
-        # Highlight the clicked button
-        if feedback_type == "good":
-            border_color = "#28a745"  # Green
-        else:
-            border_color = "#dc3545"  # Red
-
-        button.setStyleSheet(
-            f"""
-            QPushButton {{
-                border: 2px solid {border_color};
-                border-radius: 12px;
-            }}
-        """
-        )
+        self.reset_feedback_buttons()
+
+        # Highlight the clicked button (border colour comes from the feedback QSS)
+        button.setProperty("feedbackState", feedback_type)
+        _repolish(button)
 
     def handle_text_feedback_submit(self, user_text):
         """Handle submit button click with user text"""
+        if self.text_input_field is None:
+            self._process_feedback_text(user_text)
+            return
+
         # Force focus away from text input to complete any pending IME composition (Korean input)
-        if hasattr(self, "text_input_field"):
-            self.text_input_field.clearFocus()
+        self.text_input_field.clearFocus()
+        if self.text_input_field.ime_composing:
             # Use QTimer to ensure IME composition is fully processed before getting text
-            QTimer.singleShot(50, lambda: self._process_feedback_text())
+            self._feedback_text_timer.start(50)
         else:
-            self._process_feedback_text(user_text)
+            self._process_feedback_text()
 
     def _process_feedback_text(self, fallback_text=None):
         """Process feedback text after ensuring IME composition is complete"""
         # Get the final text after IME composition is complete
-        if hasattr(self, "text_input_field"):
+        if self.text_input_field is not None:
             user_text = self.text_input_field.toPlainText()
         else:
             user_text = fallback_text or ""
 
-        print(f"[FEEDBACK] User submitted text: '{user_text}'")
+        logger.debug("[FEEDBACK] User submitted text: '%s'", user_text)
 
-        # Check if text is empty - treat as skip
-        if not user_text.strip():
-            print("[FEEDBACK] Empty text, treating as skip - no API calls")
-            # Hide text input area and shrink window
-            if hasattr(self, "text_input_container"):
-                self.text_input_container.hide()
-                self.shrink_feedback_window()
-
-            # Reset button styles
-            self.reset_feedback_buttons()
+        stripped_text = user_text.strip()
 
-            # Hide feedback window
-            QTimer.singleShot(500, self.hide_feedback_window)
+        # Check if text is empty - treat as skip
+        if not stripped_text:
+            logger.debug("[FEEDBACK] Empty text, treating as skip - no API calls")
+            self._finish_feedback_submission()
 
             # Stop timeout timer since feedback is completed
-            if (
-                hasattr(self, "feedback_timeout_timer")
-                and self.feedback_timeout_timer.isActive()
-            ):
+            if self.feedback_timeout_timer.isActive():
                 self.feedback_timeout_timer.stop()
-                print("[DEBUG] Feedback submitted - timeout timer stopped")
-
-            # Reset processing flag
-            self.is_processing_feedback = False
+                logger.debug("Feedback submitted - timeout timer stopped")
             return
 
-        # Send feedback message to /feedback_message endpoint (only if text is not empty)
-        self.feedback_manager.send_feedback_message(user_text.strip())
-
         # Get feedback type and AI judgment for reflection processing
-        feedback_type = getattr(self, "selected_feedback_type", "good")
+        feedback_type = self.selected_feedback_type or "good"
 
-        if hasattr(self, "last_ai_judgement"):
-            ai_judgement_text = (
-                "distracted" if self.last_ai_judgement == 1 else "focused"
-            )
+        ai_judgement = self.last_ai_judgement
+        if ai_judgement is not None:
+            ai_judgement_text = "distracted" if ai_judgement == 1 else "focused"
         else:
             ai_judgement_text = "unknown"
 
         # 🔥 CRITICAL: Use displayed message ID for accurate feedback (not latest received)
-        feedback_image_id = (
-            self.displayed_message_image_id or self.last_llm_response_image_id
-        )
+        latest_image_id = self.last_llm_response_image_id
+        feedback_image_id = self.displayed_message_image_id or latest_image_id
         feedback_response = self.displayed_message_response or self.last_llm_response
 
         # Check if feedback is for a recently displayed message (within 5 minutes)
-        time_since_display = time.time() - (self.displayed_message_timestamp or 0)
-        if time_since_display > 300:  # 5 minutes
-            print(
-                f"[FEEDBACK_WARNING] Feedback given {time_since_display:.0f}s after message display"
+        time_since_display = time.monotonic() - (self.displayed_message_timestamp or 0)
+        if time_since_display > _STALE_FEEDBACK_SECONDS:
+            logger.warning(
+                "[FEEDBACK_WARNING] Feedback given %.0fs after message display"
+                " - it might not be for the intended message",
+                time_since_display,
             )
-            print(f"[FEEDBACK_WARNING] This might not be for the intended message")
 
-        print(f"[FEEDBACK_TARGET] Using Image ID: {feedback_image_id}")
-        print(
-            f"[FEEDBACK_TARGET] vs Latest received ID: {self.last_llm_response_image_id}"
-        )
+        logger.debug("[FEEDBACK_TARGET] Using Image ID: %s", feedback_image_id)
+        logger.debug("[FEEDBACK_TARGET] vs Latest received ID: %s", latest_image_id)
 
-        if feedback_image_id != self.last_llm_response_image_id:
-            print(
-                f"[FEEDBACK_MISMATCH] ⚠️  Feedback target differs from latest message!"
+        if feedback_image_id != latest_image_id:
+            logger.debug(
+                "[FEEDBACK_MISMATCH] ⚠️  Feedback target differs from latest message!"
             )
 
-        # Also process feedback for reflection (using displayed message data)
-        self.feedback_manager.process_feedback(
+        # Snapshot the reflection inputs now; the dispatch runs on the next loop turn
+        dispatch = partial(
+            self.feedback_manager.submit_feedback,
+            message=stripped_text,
             task_name=self.current_task,
-            llm_response=(
-                feedback_response
-                if feedback_response
-                else """
-```json
-{
-    "reason": "unknown",
-    "output": 0.0
-}
-"""
-            ),
+            llm_response=feedback_response or _FALLBACK_LLM_RESPONSE_JSON,
             image_path=self.last_analyzed_image,
             ai_judgement=ai_judgement_text,
             feedback_type=feedback_type,
@@ -2391,8 +2535,14 @@ class Dashboard(QWidget):
             user_text=user_text,  # Add user text
         )
 
+        # Tear down the input first so the window reacts before threads are set up
+        self._finish_feedback_submission()
+        QTimer.singleShot(0, Qt.TimerType.CoarseTimer, dispatch)
+
+    def _finish_feedback_submission(self):
+        """Collapse the feedback input and schedule the window to close"""
         # Hide text input area and shrink window
-        if hasattr(self, "text_input_container"):
+        if self.text_input_container is not None:
             self.text_input_container.hide()
             self.shrink_feedback_window()
 
@@ -2400,17 +2550,25 @@ class Dashboard(QWidget):
         self.reset_feedback_buttons()
 
         # Hide feedback window
-        QTimer.singleShot(500, self.hide_feedback_window)
+        self._feedback_close_timer.start(500)
 
         # Reset processing flag
         self.is_processing_feedback = False
 
+    def _reset_feedback_widgets(self):
+        """Un-highlight the buttons, hide the text input and shrink the window"""
+        self.reset_feedback_buttons()
+        if self.text_input_container is not None:
+            self.text_input_container.hide()
+        self.shrink_feedback_window()
+
     def reset_feedback_buttons(self):
         """Reset feedback button styles to default"""
-        if hasattr(self, "good_feedback_button"):
-            self.good_feedback_button.setStyleSheet("")
-        if hasattr(self, "bad_feedback_button"):
-            self.bad_feedback_button.setStyleSheet("")
+        # Only re-polish buttons that are actually highlighted
+        for button in (self.good_feedback_button, self.bad_feedback_button):
+            if button is not None and button.property("feedbackState"):
+                button.setProperty("feedbackState", "")
+                _repolish(button)
 
     def moveEvent(self, event):
         """Handle window move event to update popup window positions"""
@@ -2422,9 +2580,8 @@ class Dashboard(QWidget):
         """Update the loading animation"""
         self.loading_dots = (self.loading_dots + 1) % 4
         if self.loading_message_widget:
-            loading_text = get_text("loading")
             self.loading_message_widget.setText(
-                f"{loading_text}{'.' * self.loading_dots}"
+                f"{self._loading_text}{'.' * self.loading_dots}"
             )
 
     def _unlock_session_termination(self):
@@ -2434,70 +2591,27 @@ class Dashboard(QWidget):
     def _reset_all_feedback_states(self):
         """Reset all feedback-related states to clean slate"""
         try:
-            print("[DEBUG] Resetting ALL feedback states...")
+            logger.debug("Resetting ALL feedback states...")
 
-            # 1. Reset feedback processing flag
+            # Reset processing flag and selection, stop pending timers
             self.is_processing_feedback = False
+            self.selected_feedback_type = None
+            self.feedback_timeout_timer.stop()
+            self.feedback_hide_timer.stop()
 
-            # 2. 🔥 SAFE: Stop feedback timeout timer with exception handling
-            try:
-                if (
-                    hasattr(self, "feedback_timeout_timer")
-                    and self.feedback_timeout_timer
-                    and hasattr(self.feedback_timeout_timer, "isActive")
-                    and self.feedback_timeout_timer.isActive()
-                ):
-                    self.feedback_timeout_timer.stop()
-                    print("[DEBUG] ✅ Feedback timeout timer stopped")
-            except Exception as e:
-                print(f"[DEBUG] Error stopping feedback timeout timer: {e}")
-
-            # 3. 🔥 SAFE: Stop feedback hide timer with exception handling
-            try:
-                if (
-                    hasattr(self, "feedback_hide_timer")
-                    and self.feedback_hide_timer
-                    and hasattr(self.feedback_hide_timer, "isActive")
-                    and self.feedback_hide_timer.isActive()
-                ):
-                    self.feedback_hide_timer.stop()
-                    print("[DEBUG] ✅ Feedback hide timer stopped")
-            except Exception as e:
-                print(f"[DEBUG] Error stopping feedback hide timer: {e}")
-
-            # 4. Reset button styles to default
-            self.reset_feedback_buttons()
-
-            # 5. Hide text input area and shrink feedback window
-            if hasattr(self, "text_input_container"):
-                self.text_input_container.hide()
-                print("[DEBUG] Text input container hidden")
-
-            if hasattr(self, "shrink_feedback_window"):
-                self.shrink_feedback_window()
-                print("[DEBUG] Feedback window shrunk to default size")
-
-            # 6. Clear selected feedback type
-            if hasattr(self, "selected_feedback_type"):
-                self.selected_feedback_type = None
-                print("[DEBUG] Selected feedback type cleared")
+            # The rest only applies once the feedback window has been built
+            feedback_window = self.feedback_window
+            if feedback_window is None:
+                return
 
-            # 7. Clear text input field
-            if hasattr(self, "text_input_field"):
-                self.text_input_field.clear()
-                print("[DEBUG] Text input field cleared")
+            self._reset_feedback_widgets()
+            self.text_input_field.clear()
 
-            # 8. Hide feedback window completely
-            if (
-                hasattr(self, "window_manager")
-                and "feedback" in self.window_manager.windows
-            ):
-                feedback_window = self.window_manager.windows["feedback"]
-                if feedback_window and feedback_window.isVisible():
-                    self.hide_feedback_window()
-                    print("[DEBUG] Feedback window hidden")
+            # Hide feedback window completely
+            if feedback_window.isVisible():
+                self.hide_feedback_window()
 
-            print("[DEBUG] ✅ All feedback states reset successfully")
+            logger.debug("✅ All feedback states reset successfully")
 
         except Exception as e:
             print(f"[DEBUG] Error resetting feedback states: {e}")
@@ -2505,8 +2619,8 @@ class Dashboard(QWidget):
     def _reset_feedback_timeout(self):
         """Reset feedback processing flag after timeout"""
         if self.is_processing_feedback:
-            print(
-                "[DEBUG] Feedback timeout reached - auto-resetting feedback processing flag"
+            logger.debug(
+                "Feedback timeout reached - auto-resetting feedback processing flag"
             )
             # Use the comprehensive reset method
             self._reset_all_feedback_states()
@@ -2515,12 +2629,9 @@ class Dashboard(QWidget):
         """Handle feedback processing completion"""
         try:
             # Stop timeout timer since feedback is completed
-            if (
-                hasattr(self, "feedback_timeout_timer")
-                and self.feedback_timeout_timer.isActive()
-            ):
+            if self.feedback_timeout_timer.isActive():
                 self.feedback_timeout_timer.stop()
-                print("[DEBUG] Feedback completed - timeout timer stopped")
+                logger.debug("Feedback completed - timeout timer stopped")
 
             # Unlock session termination - user can now stop session
             self.is_processing_feedback = False
@@ -2535,13 +2646,12 @@ class Dashboard(QWidget):
             image_id = llm_response.get("image_id", None)
 
             if image_id:
-                print(
-                    f"[FEEDBACK_STORAGE] New LLM response received - Image ID: {image_id}"
+                logger.debug(
+                    "[FEEDBACK_STORAGE] New LLM response received - Image ID: %s",
+                    image_id,
                 )
 
                 self.last_llm_response = llm_response
-                self.last_llm_response_reason = llm_response.get("reason", "")
-                self.last_llm_response_image_path = analyzed_image_path
                 self.last_llm_response_image_id = image_id
 
                 # Store image path for feedback (this was missing!)
@@ -2553,45 +2663,65 @@ class Dashboard(QWidget):
                     1 if output >= 0.5 else 0
                 )  # 1=distracted, 0=focused
 
-                print(
-                    f"[FEEDBACK] AI judgment stored: {self.last_ai_judgement} ({'distracted' if self.last_ai_judgement == 1 else 'focused'})"
+                logger.debug(
+                    "[FEEDBACK] AI judgment stored: %s (%s)",
+                    self.last_ai_judgement,
+                    "distracted" if self.last_ai_judgement == 1 else "focused",
                 )
 
                 # Check if this creates a mismatch with displayed message
                 if (
-                    hasattr(self, "displayed_message_image_id")
-                    and self.displayed_message_image_id
+                    self.displayed_message_image_id
                     and self.displayed_message_image_id != image_id
                 ):
-                    print(
-                        f"[FEEDBACK_STORAGE] ⚠️  New message received while user sees different message!"
+                    logger.debug(
+                        "[FEEDBACK_STORAGE] ⚠️  New message received while user sees different message!"
                     )
-                    print(
-                        f"[FEEDBACK_STORAGE] Displayed: {self.displayed_message_image_id} | New: {image_id}"
+                    logger.debug(
+                        "[FEEDBACK_STORAGE] Displayed: %s | New: %s",
+                        self.displayed_message_image_id,
+                        image_id,
                     )
 
         except Exception as e:
             print(f"[ERROR] Failed to store LLM response: {e}")
 
+    def _make_single_shot(self, slot, interval=None):
+        """Build a dashboard-owned, coarse, single-shot timer connected to slot"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.TimerType.CoarseTimer)
+        if interval is not None:
+            timer.setInterval(interval)
+        timer.timeout.connect(slot)
+        return timer
+
     def cleanup(self):
         """Clean up resources when dashboard is being destroyed"""
         print("[DASHBOARD] Starting cleanup...")
 
         # Stop focus monitoring
         self.stop_focus_monitoring()
+        self._set_popup_click_filter(False)
+        if self._app_activation_observer is not None:
+            NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(
+                self._app_activation_observer
+            )
+            self._app_activation_observer = None
+
+        # Stop every dashboard timer so none fires into a half torn-down UI
+        for timer in self.findChildren(QTimer):
+            timer.stop()
 
         # Clean up all manager threads
-        if hasattr(self, "session_rating_manager"):
-            self.session_rating_manager.cleanup()
+        self.session_rating_manager.cleanup()
 
-        if hasattr(self, "llm_client"):
-            self.llm_client.cleanup()
+        self.llm_client.cleanup()
 
-        if hasattr(self, "feedback_manager"):
-            self.feedback_manager.cleanup()
+        self.feedback_manager.cleanup()
 
         # Clean up ThreadManager (most important)
-        if hasattr(self, "thread_manager"):
+        if self.thread_manager is not None:
             self.thread_manager.stop()
 
         print("[DASHBOARD] Cleanup complete")
@@ -2611,39 +2741,26 @@ class Dashboard(QWidget):
 
     def clear_clarification_chat(self):
         """Clear the clarification chat"""
-        # Remove all widgets from chat layout
-        while self.chat_layout.count():
-            child = self.chat_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # The loading bubble is about to go away with the old container
+        self.stop_loading_animation()
 
-        # Add stretch back
-        self.chat_layout.addStretch()
+        # Swap in an empty message container instead of removing messages one by one
+        self.window_manager.reset_chat_container()
 
         # Clear conversation history
         self.clarification_conversation = []
+        self._chat_stick_to_bottom = True
 
     def add_clarification_message(self, text, is_user=True):
         """Add a message to the clarification chat"""
-        # Remove the stretch from the end
-        if self.chat_layout.count() > 0:
-            last_item = self.chat_layout.itemAt(self.chat_layout.count() - 1)
-            if last_item.spacerItem():
-                self.chat_layout.removeItem(last_item)
+        if is_user:
+            # Always bring the user's own message into view
+            self._chat_stick_to_bottom = True
 
         # Create message label
         message_label = QLabel(text)
         message_label.setWordWrap(True)
-        message_label.setStyleSheet(
-            f"""
-            background-color: {'#E5E5EA' if is_user else '#007AFF'};
-            color: {'#000000' if is_user else '#FFFFFF'};
-            border-radius: 12px;
-            padding: 8px 12px;
-            margin: 2px;
-            max-width: 250px;
-        """
-        )
+        message_label.setStyleSheet(_CHAT_BUBBLE_QSS[bool(is_user)])
 
         # Create container for alignment
         message_container = QWidget()
@@ -2659,10 +2776,8 @@ class Dashboard(QWidget):
             container_layout.addWidget(message_label)
             container_layout.addStretch()
 
-        self.chat_layout.addWidget(message_container)
-
-        # Add stretch at the end
-        self.chat_layout.addStretch()
+        # Insert just before the trailing stretch, which stays in the layout
+        self.chat_layout.insertWidget(self.chat_layout.count() - 1, message_container)
 
         # Handle loading animation
         loading_text = get_text("loading")
@@ -2670,16 +2785,15 @@ class Dashboard(QWidget):
             # Start loading animation for AI loading messages
             self.loading_message_widget = message_label
             self.loading_dots = 0
-            self.loading_timer.start(500)  # Update every 500ms
+            self._loading_text = loading_text
+            # Keep the running cadence rather than cancelling and rescheduling
+            if not self.loading_timer.isActive():
+                self.loading_timer.start()
         else:
             # Stop loading animation for any other message
             self.stop_loading_animation()
 
-        # Scroll to bottom
-        QTimer.singleShot(50, self.scroll_clarification_to_bottom)
-
         # Store in conversation history (but not loading messages)
-        loading_text = get_text("loading")
         if not text.startswith(loading_text):
             self.clarification_conversation.append({"text": text, "is_user": is_user})
 
@@ -2689,10 +2803,16 @@ class Dashboard(QWidget):
             self.loading_timer.stop()
         self.loading_message_widget = None
 
-    def scroll_clarification_to_bottom(self):
-        """Scroll clarification chat to bottom"""
-        scrollbar = self.chat_scroll.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+    def _on_chat_range_changed(self, _minimum, maximum):
+        """Keep the clarification chat pinned to the newest message once laid out"""
+        if self._chat_stick_to_bottom:
+            self.chat_scroll.verticalScrollBar().setValue(maximum)
+
+    def _on_chat_scrolled(self, value):
+        """Stop following new messages while the user reads further up"""
+        self._chat_stick_to_bottom = (
+            value >= self.chat_scroll.verticalScrollBar().maximum()
+        )
 
     def send_clarification_message(self):
         """Handle sending a clarification message"""
@@ -2705,182 +2825,101 @@ class Dashboard(QWidget):
             # Add user answer to clarification cycle
             self.llm_client.add_user_answer(message)
 
+    def _begin_chat_batch(self):
+        """Hold clarification chat repaints while several edits are made"""
+        self.chat_scroll.viewport().setUpdatesEnabled(False)
+
+    def _end_chat_batch(self):
+        """Repaint the clarification chat once after a batch of edits"""
+        self.chat_scroll.viewport().setUpdatesEnabled(True)
+
     def on_clarification_question_received(self, response):
         """Handle clarification question from LLM"""
+        self._begin_chat_batch()
+        try:
+            # Remove the "Loading..." message
+            self.remove_last_clarification_message()
 
-        # Remove the "Loading..." message
-        self.remove_last_clarification_message()
-
-        # Add the actual AI response
-        self.add_clarification_message(response, is_user=False)
+            # Add the actual AI response
+            self.add_clarification_message(response, is_user=False)
+        finally:
+            self._end_chat_batch()
 
     def on_augmentation_received(self, response):
         """Handle augmentation response from LLM"""
+        self._begin_chat_batch()
+        try:
+            self._handle_augmentation_response(response)
+        finally:
+            self._end_chat_batch()
 
+    def _handle_augmentation_response(self, response):
+        """Replace the loading message and store the augmented intentions"""
         # Remove the "Loading..." message
         self.remove_last_clarification_message()
 
         # Parse JSON response and save to memory
         try:
-            import json
-            import re
-
-            # Clean the response
-            response_str = re.sub(r"```(?:json)?", "", response).strip()
-
-            if response_str:
-                data_dict = json.loads(response_str)
-                sorted_list = [data_dict[str(i)] for i in range(1, 11)]
-
-                # Store clarification data in memory for immediate use
-                self.current_clarification_data = sorted_list
-                print(f"[CLARIFICATION] Augmented to {len(sorted_list)} intentions")
+            intentions = self._parse_augmentation(response)
+            if intentions is not None:
+                print(f"[CLARIFICATION] Augmented to {len(intentions)} intentions")
 
                 # Also save to file for persistence (optional)
-                filepath = self.llm_client.save_results(sorted_list)
-
-                # Show simple completion message
-                completion_msg = get_text("clarification_complete")
-                self.add_clarification_message(completion_msg, is_user=False)
-
-                # Disable send button and input field after completion
-                self.disable_clarification_input()
-
-                # Auto-start capture if flag is set and not already capturing
-                if (
-                    getattr(self, "auto_start_after_clarification", False)
-                    and not self.is_capturing
-                ):
-                    self.auto_start_after_clarification = False
-                    # Hide clarification window and start capture
-                    self.hide_clarification_window()
-                    QTimer.singleShot(
-                        500, self.toggle_capture
-                    )  # Small delay to ensure UI updates
-                elif self.is_capturing:
-                    # Already capturing, just update clarification data
-                    print(
-                        "[CLARIFICATION] Already capturing, just updating clarification data"
-                    )
-                    self.auto_start_after_clarification = False
-
-            else:
-                # Show simple completion message even if augmentation failed
-                completion_msg = get_text("clarification_complete")
-                self.add_clarification_message(completion_msg, is_user=False)
-
-                # Disable send button and input field after completion
-                self.disable_clarification_input()
-
-                # Auto-start capture if flag is set and not already capturing (even if augmentation failed)
-                if (
-                    getattr(self, "auto_start_after_clarification", False)
-                    and not self.is_capturing
-                ):
-                    self.auto_start_after_clarification = False
-                    # Use original intention as fallback
-                    if hasattr(self, "llm_client") and hasattr(
-                        self.llm_client, "clarification_manager"
-                    ):
-                        original_intention = (
-                            self.llm_client.clarification_manager.stated_intention
-                        )
-                        self.current_clarification_data = [original_intention] * 10
-                    # Hide clarification window and start capture
-                    self.hide_clarification_window()
-                    QTimer.singleShot(500, self.toggle_capture)
-                elif self.is_capturing:
-                    # Already capturing, just use original intention as fallback
-                    print(
-                        "[CLARIFICATION] Already capturing, using original intention as fallback"
-                    )
-                    if hasattr(self, "llm_client") and hasattr(
-                        self.llm_client, "clarification_manager"
-                    ):
-                        original_intention = (
-                            self.llm_client.clarification_manager.stated_intention
-                        )
-                        self.current_clarification_data = [original_intention] * 10
-                    self.auto_start_after_clarification = False
-
+                self.llm_client.save_results(intentions)
         except json.JSONDecodeError as e:
             print(f"Failed to parse JSON: {e}")
-            # Show simple completion message even if parsing failed
-            completion_msg = get_text("clarification_complete")
-            self.add_clarification_message(completion_msg, is_user=False)
-
-            # Disable send button and input field after completion
-            self.disable_clarification_input()
-
-            # Auto-start capture if flag is set and not already capturing (even if JSON parsing failed)
-            if (
-                getattr(self, "auto_start_after_clarification", False)
-                and not self.is_capturing
-            ):
-                self.auto_start_after_clarification = False
-                # Use original intention as fallback
-                if hasattr(self, "llm_client") and hasattr(
-                    self.llm_client, "clarification_manager"
-                ):
-                    original_intention = (
-                        self.llm_client.clarification_manager.stated_intention
-                    )
-                    self.current_clarification_data = [original_intention] * 10
-                # Hide clarification window and start capture
-                self.hide_clarification_window()
-                QTimer.singleShot(500, self.toggle_capture)
-            elif self.is_capturing:
-                # Already capturing, just use original intention as fallback
-                print(
-                    "[CLARIFICATION] Already capturing, using original intention as fallback (JSON parse error)"
-                )
-                if hasattr(self, "llm_client") and hasattr(
-                    self.llm_client, "clarification_manager"
-                ):
-                    original_intention = (
-                        self.llm_client.clarification_manager.stated_intention
-                    )
-                    self.current_clarification_data = [original_intention] * 10
-                self.auto_start_after_clarification = False
+            intentions = None
         except Exception as e:
             print(f"Error processing augmentation: {e}")
-            # Show simple completion message even if error occurred
-            completion_msg = get_text("clarification_complete")
-            self.add_clarification_message(completion_msg, is_user=False)
-
-            # Disable send button and input field after completion
-            self.disable_clarification_input()
-
-            # Auto-start capture if flag is set and not already capturing (even if error occurred)
-            if (
-                getattr(self, "auto_start_after_clarification", False)
-                and not self.is_capturing
-            ):
-                self.auto_start_after_clarification = False
-                # Use original intention as fallback
-                if hasattr(self, "llm_client") and hasattr(
-                    self.llm_client, "clarification_manager"
-                ):
-                    original_intention = (
-                        self.llm_client.clarification_manager.stated_intention
-                    )
-                    self.current_clarification_data = [original_intention] * 10
-                # Hide clarification window and start capture
-                self.hide_clarification_window()
-                QTimer.singleShot(500, self.toggle_capture)
-            elif self.is_capturing:
-                # Already capturing, just use original intention as fallback
-                print(
-                    "[CLARIFICATION] Already capturing, using original intention as fallback (general error)"
-                )
-                if hasattr(self, "llm_client") and hasattr(
-                    self.llm_client, "clarification_manager"
-                ):
-                    original_intention = (
-                        self.llm_client.clarification_manager.stated_intention
-                    )
-                    self.current_clarification_data = [original_intention] * 10
-                self.auto_start_after_clarification = False
+            intentions = None
+
+        self._finalize_clarification(intentions)
+
+    def _parse_augmentation(self, response):
+        """Return the 10 augmented intentions from an LLM response, or None if empty"""
+        # Clean the response
+        response_str = _CODE_FENCE_RE.sub("", response).strip()
+        if not response_str:
+            return None
+
+        data_dict = json.loads(response_str)
+        values = list(data_dict.values())
+        if len(values) >= 10:
+            # Common case: keys "1".."10" arrive in order
+            return values[:10]
+
+        # Fill any missing slots with the stated intention instead of failing
+        original_intention = self.llm_client.clarification_manager.stated_intention
+        return [data_dict.get(str(i), original_intention) for i in range(1, 11)]
+
+    def _finalize_clarification(self, intentions):
+        """Close the clarification chat and start capture if it was requested"""
+        # Show simple completion message (also when augmentation failed)
+        completion_msg = get_text("clarification_complete")
+        self.add_clarification_message(completion_msg, is_user=False)
+
+        # Disable send button and input field after completion
+        self.disable_clarification_input()
+
+        auto_start = self.auto_start_after_clarification and not self.is_capturing
+        if intentions is None and (auto_start or self.is_capturing):
+            # Augmentation failed - use original intention as fallback
+            original_intention = self.llm_client.clarification_manager.stated_intention
+            intentions = [original_intention] * 10
+
+        # Store clarification data in memory for immediate use
+        if intentions is not None:
+            self.current_clarification_data = intentions
+
+        if auto_start:
+            # Hide clarification window and start capture
+            self.hide_clarification_window()
+            # Small delay to ensure UI updates
+            self._auto_start_timer.start(500)
+        elif self.is_capturing:
+            print("[CLARIFICATION] Already capturing, just updating clarification data")
+
+        self.auto_start_after_clarification = False
 
     def get_last_ai_message(self):
         """Get the last AI message from conversation history"""
@@ -2904,12 +2943,18 @@ class Dashboard(QWidget):
         """Handle clarification API error"""
         print(f"[CLARIFICATION] Error: {error_message}")
 
-        # Remove the "Loading..." message
-        self.remove_last_clarification_message()
+        self._begin_chat_batch()
+        try:
+            # Remove the "Loading..." message
+            self.remove_last_clarification_message()
 
-        # Add fallback message
-        fallback_message = "Hey! Could you be a bit more specific about your intention?"
-        self.add_clarification_message(fallback_message, is_user=False)
+            # Add fallback message
+            fallback_message = (
+                "Hey! Could you be a bit more specific about your intention?"
+            )
+            self.add_clarification_message(fallback_message, is_user=False)
+        finally:
+            self._end_chat_batch()
 
     def remove_last_clarification_message(self):
         """Remove the last message from clarification chat (used to remove loading message)"""
@@ -2928,7 +2973,7 @@ class Dashboard(QWidget):
     def reset_rating_progress(self):
         """Reset rating progress bar to default state"""
         self.current_rating = 0
-        if hasattr(self, "progress_bar"):
+        if self.progress_bar is not None:
             self.progress_bar.set_value(0)  # Reset to no selection
 
         # Disable UI elements while rating window is visible
@@ -2937,29 +2982,34 @@ class Dashboard(QWidget):
     def set_rating(self, rating):
         """Set the session rating and submit"""
         self.current_rating = rating
-        print(
-            f"[RATING] User rated session: {rating}/5 (0%=1, 25%=2, 50%=3, 75%=4, 100%=5)"
+        logger.debug(
+            "[RATING] User rated session: %s/5 (0%%=1, 25%%=2, 50%%=3, 75%%=4, 100%%=5)",
+            rating,
         )
 
         # Prepare session info for rating submission
+        user_info = self.user_config.get_user_info()
+        task = self.current_task
         session_info = {
-            "user_id": self.user_config.get_user_info()["name"],
-            "session_id": getattr(self, "current_session_start_time", None),
-            "task_name": self.current_task or "Unknown Task",
-            "intention": self.current_task or "",
-            "device_name": self.user_config.get_user_info()["device_name"],
+            "user_id": user_info["name"],
+            "session_id": self.current_session_start_time,
+            "task_name": task or "Unknown Task",
+            "intention": task or "",
+            "device_name": user_info["device_name"],
             "app_mode": "rating_submission",
         }
 
         # Store rating in history manager and end session immediately
-        if hasattr(self, "history_manager") and self.history_manager:
+        if self.history_manager:
             self.history_manager.set_session_rating(rating)
-            print(f"[RATING] Stored rating in history: {rating}/5")
+            logger.debug("[RATING] Stored rating in history: %s/5", rating)
 
             # End session immediately to save with rating
             session_ended = self.history_manager.end_intention_session()
             if session_ended:
-                print(f"[RATING] Session ended and saved with rating: {rating}/5")
+                logger.debug(
+                    "[RATING] Session ended and saved with rating: %s/5", rating
+                )
                 # Refresh the timeline display
                 self.load_and_display_today_history()
                 # Update rating display immediately
@@ -2967,15 +3017,17 @@ class Dashboard(QWidget):
 
         # Send rating to backend
         if self.session_rating_manager and session_info["session_id"]:
-            print(f"[RATING] Sending rating to backend: {rating}/5")
+            logger.debug("[RATING] Sending rating to backend: %s/5", rating)
             self.session_rating_manager.send_session_rating(
-                rating=rating, session_info=session_info, task_name=self.current_task
+                rating=rating, session_info=session_info, task_name=task
             )
         else:
-            print("[RATING] Warning: Could not send rating - missing session info")
+            logger.warning(
+                "[RATING] Warning: Could not send rating - missing session info"
+            )
 
         # Hide rating window after 1 second and show history
-        QTimer.singleShot(1000, self.on_rating_complete)
+        self._rating_complete_timer.start(1000)
 
     def on_rating_complete(self):
         """Called when rating is complete"""
@@ -2986,7 +3038,7 @@ class Dashboard(QWidget):
 
         # 🔥 CRITICAL: Reset ALL feedback states when session ends
         self._reset_all_feedback_states()
-        print("[DEBUG] All feedback states reset on session complete")
+        logger.debug("All feedback states reset on session complete")
 
         # Hide rating window
         self.hide_rating_window()
@@ -2996,7 +3048,7 @@ class Dashboard(QWidget):
 
         # Now clear session info after rating is complete
         self.current_session_start_time = None
-        print("[DEBUG] Rating complete, session_id cleared")
+        logger.debug("Rating complete, session_id cleared")
 
         # Reset current task to empty state
         self._current_task = ""
@@ -3004,7 +3056,7 @@ class Dashboard(QWidget):
         self.task_display.clear()
 
         # Switch back to input state (this will show Set button and history window for non-BASIC modes)
-        QTimer.singleShot(300, self.show_input_state)
+        self._input_state_timer.start(300)
 
         # 🔥 CRITICAL: DO NOT restart focus monitoring after manual stop
         # Focus monitoring should only restart when user manually sets new intention
@@ -3014,67 +3066,23 @@ class Dashboard(QWidget):
     def disable_ui_for_rating(self):
         """Disable all UI elements when rating window is visible"""
         if APP_MODE == APP_MODE_BASIC:
-            # Baseline mode - disable start button
+            # Baseline mode - disable start button (greyed out by its :disabled rule)
             self.start_button.setEnabled(False)
-            self.start_button.setStyleSheet(
-                """
-                #bigStartButton {
-                    background-color: #666666;
-                    color: #999999;
-                    font-size: 24px;
-                    font-weight: bold;
-                    border-radius: 10px;
-                }
-            """
-            )
         else:
             # Full/Control mode - disable task display and start button
             self.task_display.setEnabled(False)
             self.start_button.setEnabled(False)
 
-            # Apply disabled styling
-            self.task_display.setStyleSheet(
-                """
-                QTextEdit#taskDisplay { 
-                    background-color: #666666; 
-                    border-radius: 8px; 
-                    padding: 8px 12px; 
-                    font-size: 13px; 
-                    color: #999999; 
-                }
-            """
-            )
-
-            self.start_button.setStyleSheet(
-                """
-                #startButton {
-                    background-color: #666666;
-                    color: #999999;
-                    font-size: 14px;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-weight: 600;
-                    min-width: 40px;
-                }
-            """
-            )
-
     def enable_ui_after_rating(self):
         """Re-enable all UI elements after rating is complete"""
         if APP_MODE == APP_MODE_BASIC:
             # Baseline mode - re-enable start button
             self.start_button.setEnabled(True)
-            self.start_button.setStyleSheet("")  # Reset to default stylesheet
         else:
             # Full/Control mode - re-enable task display and start button
             self.task_display.setEnabled(True)
             self.start_button.setEnabled(True)
 
-            # Reset to default styling
-            self.task_display.setStyleSheet("")
-            self.start_button.setStyleSheet("")
-
     def on_intention_selected(self, intention, record):
         """Handle intention selection from timeline"""
         print(f"[DASHBOARD] Selected intention: {intention}")
@@ -3087,17 +3095,9 @@ class Dashboard(QWidget):
         # Clear any session state
         self.current_session_start_time = None
 
-        # Clear the input field first to remove placeholder
-        self.task_input.clear()
-
         # Set the intention text in both input and display
-        self.task_input.setText(intention)
-        self.task_display.setText(intention)
-
-        # Force UI update to show the text
+        self._set_task_text(intention)
         self.task_input.setFocus()
-        self.task_input.update()
-        self.task_input.repaint()
 
         # Update current task
         self.current_task = intention
@@ -3105,9 +3105,6 @@ class Dashboard(QWidget):
         # Switch to task display state (showing the intention and start button)
         self.show_task_state()
 
-        # Additional fix: Ensure text is visible after UI state change
-        QTimer.singleShot(50, lambda: self._ensure_text_visible(intention))
-
         # Load past clarification and reflection data
         self.load_past_settings(intention, record)
 
@@ -3116,34 +3113,19 @@ class Dashboard(QWidget):
 
         print(f"[DASHBOARD] Ready to start with: {intention}")
 
-    def _ensure_text_visible(self, intention):
-        """Ensure the intention text is visible in both input fields"""
-        # Double-check that the text is in both fields
-        input_text = self.task_input.toPlainText()
-        display_text = self.task_display.toPlainText()
-
-        if input_text != intention:
-            print(f"[DEBUG] Input text mismatch. Setting again: '{intention}'")
-            self.task_input.setText(intention)
-
-        if display_text != intention:
-            print(f"[DEBUG] Display text mismatch. Setting again: '{intention}'")
-            self.task_display.setText(intention)
-
-        # Force update on the currently visible element (task_display)
-        self.task_display.update()
-
-        print(f"[DEBUG] Final text - Input: '{input_text}', Display: '{display_text}'")
+    def _set_task_text(self, text):
+        """Write text to the task input and display without textChanged dispatch"""
+        # setPlainText never interprets the text as rich text
+        with QSignalBlocker(self.task_input), QSignalBlocker(self.task_display):
+            self.task_input.setPlainText(text)
+            self.task_display.setPlainText(text)
 
     def load_past_settings(self, intention, record):
-        """Load clarification and reflection data for the selected intention"""
+        """Load clarification data for the selected intention"""
         try:
             # Load clarification data using session_id from record
             self.load_clarification_for_intention(intention, record)
 
-            # Load reflection data
-            self.load_reflection_for_intention(intention)
-
             print(f"[DASHBOARD] Loaded past settings for: {intention}")
 
         except Exception as e:
@@ -3152,10 +3134,6 @@ class Dashboard(QWidget):
     def load_clarification_for_intention(self, intention, record=None):
         """Load clarification data for a specific intention using session_id if available"""
         try:
-            from ..logging.storage import LocalStorage
-
-            storage = LocalStorage()
-
             # Try to use session_id from record first
             session_id = None
             if record and "session_id" in record:
@@ -3169,178 +3147,74 @@ class Dashboard(QWidget):
                 )
             else:
                 # Fallback to old method using task name
-                clean_task_name = "".join(
-                    c for c in intention if c.isalnum() or c in (" ", "-", "_")
-                ).rstrip()
-                clean_task_name = clean_task_name.replace(" ", "_")
+                clean_task_name = _clean_task_name(intention)
                 clarification_file = f"{clean_task_name}_clarification.json"
                 print(
                     f"[DASHBOARD] Fallback: Looking for clarification with task name: {clean_task_name}"
                 )
 
-            clarification_path = os.path.join(
-                storage.get_clarification_data_dir(), clarification_file
-            )
-
-            if os.path.exists(clarification_path):
-                with open(clarification_path, "r", encoding="utf-8") as f:
-                    clarification_data = json.load(f)
-
-                # Set clarification data in thread manager
-                if hasattr(self, "thread_manager"):
-                    self.thread_manager.set_clarification_data(clarification_data)
-                    print(
-                        f"[DASHBOARD] Loaded clarification data for: {intention} (file: {clarification_file})"
-                    )
-            else:
+            clarification_data = self._read_clarification_file(clarification_file)
+            if clarification_data is None:
                 print(f"[DASHBOARD] No clarification file found: {clarification_file}")
+                return
+
+            # Set clarification data in thread manager
+            if self.thread_manager is not None:
+                self.thread_manager.set_clarification_data(clarification_data)
+                print(
+                    f"[DASHBOARD] Loaded clarification data for: {intention} (file: {clarification_file})"
+                )
 
         except Exception as e:
             print(f"[ERROR] Failed to load clarification data: {e}")
 
-    def load_reflection_for_intention(self, intention):
-        """Load reflection/feedback data for a specific intention"""
-        try:
-            from ..logging.storage import LocalStorage
-
-            storage = LocalStorage()
-
-            # Clean task name for filename
-            clean_task_name = "".join(
-                c for c in intention if c.isalnum() or c in (" ", "-", "_")
-            ).rstrip()
-            clean_task_name = clean_task_name.replace(" ", "_")
-
-            # Try to load different types of reflection data files
-            reflection_files = [
-                f"{clean_task_name}_dislike_on_notification.json",
-                f"{clean_task_name}_dislike_on_focus.json",
-                f"{clean_task_name}_like_on_notification.json",
-                f"{clean_task_name}_like_on_focus.json",
-            ]
-
-            reflection_data = {
-                "dislike_on_notification": [],
-                "dislike_on_focus": [],
-                "like_on_notification": [],
-                "like_on_focus": [],
-            }
+    def _read_clarification_file(self, clarification_file):
+        """Parsed clarification file, or None if it does not exist (cached)"""
+        cache = self._clarification_file_cache
+        if clarification_file in cache:
+            return cache[clarification_file]
 
-            reflection_types = [
-                "dislike_on_notification",
-                "dislike_on_focus",
-                "like_on_notification",
-                "like_on_focus",
-            ]
-
-            # Load each type of reflection data if file exists
-            loaded_count = 0
-            for i, filename in enumerate(reflection_files):
-                file_path = os.path.join(storage.get_clarification_data_dir(), filename)
-                if os.path.exists(file_path):
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            reflection_data[reflection_types[i]] = data
-                            loaded_count += 1
-                    except Exception as e:
-                        print(f"[ERROR] Failed to load {filename}: {e}")
-
-            # Set reflection data in thread manager
-            if hasattr(self, "thread_manager"):
-                self.thread_manager.set_dislike_on_notification(
-                    reflection_data["dislike_on_notification"]
-                )
-                self.thread_manager.set_dislike_on_focus(
-                    reflection_data["dislike_on_focus"]
-                )
-                self.thread_manager.set_like_on_notification(
-                    reflection_data["like_on_notification"]
-                )
-                self.thread_manager.set_like_on_focus(reflection_data["like_on_focus"])
+        clarification_path = os.path.join(
+            self.storage.get_clarification_data_dir(), clarification_file
+        )
+        # Open directly rather than stat first; a missing file is the common miss
+        try:
+            with open(clarification_path, "r", encoding="utf-8") as f:
+                clarification_data = json.load(f)
+        except FileNotFoundError:
+            clarification_data = None
+        else:
+            # Watch the file too: rewriting it in place may not touch the directory
+            self._clarification_watcher.addPath(clarification_path)
 
-                if loaded_count > 0:
-                    print(
-                        f"[DASHBOARD] Loaded {loaded_count} reflection data files for: {intention}"
-                    )
-                else:
-                    print(f"[DASHBOARD] No reflection data found for: {intention}")
+        cache[clarification_file] = clarification_data
+        return clarification_data
 
-        except Exception as e:
-            print(f"[ERROR] Failed to load reflection data: {e}")
+    def _invalidate_clarification_cache(self, _path=None):
+        """Forget parsed clarification files after something changed on disk"""
+        self._clarification_file_cache.clear()
 
     def disable_clarification_input(self):
         """Disable the clarification input field and send button after 2 turns"""
-        if hasattr(self, "clarification_input"):
+        if self.clarification_input is not None:
             self.clarification_input.setEnabled(False)
             self.clarification_input.setPlaceholderText("Clarification completed")
-            self.clarification_input.setStyleSheet(
-                """
-                #clarificationInput {
-                    background-color: #666666;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-size: 13px;
-                    color: #999999;
-                }
-            """
-            )
 
-        if hasattr(self, "clarification_send_button"):
+        if self.clarification_send_button is not None:
             self.clarification_send_button.setEnabled(False)
-            self.clarification_send_button.setStyleSheet(
-                """
-                #clarificationSendButton {
-                    background-color: #666666;
-                    color: #999999;
-                    font-size: 13px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 8px;
-                }
-            """
-            )
 
         print("[CLARIFICATION] Input and send button disabled after 2 turns")
 
     def enable_clarification_input(self):
         """Enable the clarification input field and send button for new clarification"""
-        if hasattr(self, "clarification_input"):
+        if self.clarification_input is not None:
             self.clarification_input.setEnabled(True)
             self.clarification_input.setPlaceholderText(
                 get_text("clarification_placeholder")
             )
-            self.clarification_input.setStyleSheet(
-                """
-                #clarificationInput {
-                    background-color: #2D2D2D;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-size: 13px;
-                    color: white;
-                }
-            """
-            )
 
-        if hasattr(self, "clarification_send_button"):
+        if self.clarification_send_button is not None:
             self.clarification_send_button.setEnabled(True)
-            self.clarification_send_button.setStyleSheet(
-                """
-                #clarificationSendButton {
-                    background-color: #FFD60A;
-                    color: #000000;
-                    font-size: 13px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 8px;
-                }
-                #clarificationSendButton:hover {
-                    background-color: #FFED4E;
-                }
-            """
-            )
 
         print("[CLARIFICATION] Input and send button enabled for new clarification")
 
@@ -3350,18 +3224,13 @@ class Dashboard(QWidget):
         if not self.is_clarification_window_visible():
             return False
 
-        if hasattr(self, "llm_client") and hasattr(
-            self.llm_client, "clarification_manager"
-        ):
-            manager = self.llm_client.clarification_manager
-            # Clarification is in progress if it has started but not completed
-            return (
-                manager.stated_intention
-                and not manager.is_complete
-                and len(manager.qa_pairs) >= 0
-            )  # At least started (even with 0 Q&A pairs)
-
-        return False
+        manager = self.llm_client.clarification_manager
+        # Clarification is in progress if it has started but not completed
+        return (
+            manager.stated_intention
+            and not manager.is_complete
+            and len(manager.qa_pairs) >= 0
+        )  # At least started (even with 0 Q&A pairs)
 
     def force_complete_clarification_and_start(self):
         """Force complete clarification with current responses and then start capture"""
@@ -3383,73 +3252,56 @@ class Dashboard(QWidget):
 
         # Update task display to readonly mode immediately
         self.task_display.setReadOnly(True)
-        self.task_display.setStyleSheet(
-            "background-color: #343434; color: white; border-radius: 8px;"
-        )
+        _repolish(self.task_display)
 
         # Start intention session immediately (skip history tracking for BASIC mode)
         if APP_MODE != APP_MODE_BASIC:
             self.start_intention_session(self._current_task)
 
         # Handle clarification completion in background
-        if hasattr(self, "llm_client") and hasattr(
-            self.llm_client, "clarification_manager"
-        ):
-            manager = self.llm_client.clarification_manager
-
-            # Force complete the clarification
-            manager.is_complete = True
-
-            # Use current Q&A pairs as immediate clarification data
-            # Even if empty, we'll proceed with original intention
-            if manager.qa_pairs:
-                # Use existing Q&A pairs to create basic clarification data
-                clarification_text = f"{manager.stated_intention}\n\n"
-                clarification_text += "\n\n".join(
-                    [f"Q: {q}\nA: {a}" for q, a in manager.qa_pairs]
-                )
-                self.current_clarification_data = [clarification_text] * 10
-                print(
-                    f"[CLARIFICATION] Using {len(manager.qa_pairs)} Q&A pairs for immediate start"
-                )
-            else:
-                # No Q&A pairs, use original intention
-                self.current_clarification_data = [manager.stated_intention] * 10
-                print(
-                    "[CLARIFICATION] No Q&A pairs, using original intention for immediate start"
-                )
+        manager = self.llm_client.clarification_manager
 
-            # Set clarification data in thread manager immediately
-            if hasattr(self, "thread_manager"):
-                self.thread_manager.set_clarification_data(
-                    self.current_clarification_data
-                )
+        # Force complete the clarification
+        manager.is_complete = True
 
-            # Show completion message in background
-            self.add_clarification_message(
-                "Completing clarification with current responses...", is_user=False
+        # Use current Q&A pairs as immediate clarification data
+        # Even if empty, we'll proceed with original intention
+        if manager.qa_pairs:
+            # Use existing Q&A pairs to create basic clarification data
+            qa_text = "\n\n".join(f"Q: {q}\nA: {a}" for q, a in manager.qa_pairs)
+            clarification_text = f"{manager.stated_intention}\n\n{qa_text}"
+            print(
+                f"[CLARIFICATION] Using {len(manager.qa_pairs)} Q&A pairs for immediate start"
+            )
+        else:
+            # No Q&A pairs, use original intention
+            clarification_text = manager.stated_intention
+            print(
+                "[CLARIFICATION] No Q&A pairs, using original intention for immediate start"
             )
+        # The ten slots share one string object
+        self.current_clarification_data = [clarification_text] * 10
 
-            # Request augmentation with current Q&A pairs (even if empty)
-            # This will run in background and update clarification data later
-            self.llm_client.request_augmentation()
+        # Set clarification data in thread manager immediately
+        if self.thread_manager is not None:
+            self.thread_manager.set_clarification_data(self.current_clarification_data)
 
-            # Clear the auto-start flag since we're already starting
-            self.auto_start_after_clarification = False
-        else:
-            # Fallback: No clarification manager, use original intention
-            print("[CLARIFICATION] No clarification manager - using original intention")
-            self.current_clarification_data = [self._current_task] * 10
-            # Set clarification data in thread manager immediately
-            if hasattr(self, "thread_manager"):
-                self.thread_manager.set_clarification_data(
-                    self.current_clarification_data
-                )
+        # Show completion message in background
+        self.add_clarification_message(
+            "Completing clarification with current responses...", is_user=False
+        )
+
+        # Request augmentation with current Q&A pairs (even if empty)
+        # This will run in background and update clarification data later
+        self.llm_client.request_augmentation()
+
+        # Clear the auto-start flag since we're already starting
+        self.auto_start_after_clarification = False
 
         # Update message based on APP_MODE
         if APP_MODE == APP_MODE_REMINDER:
             # In reminder mode, show encouragement message
-            if self._is_korean_text(self.current_task):
+            if _contains_hangul(self.current_task):
                 encouragement_message = get_text(
                     "encouragement_korean", task=self.current_task
                 )
@@ -3457,9 +3309,8 @@ class Dashboard(QWidget):
                 encouragement_message = get_text(
                     "encouragement_english", task=self.current_task
                 )
-            QTimer.singleShot(
-                1000, lambda: self._show_reminder_message(encouragement_message)
-            )
+            self._pending_reminder_message = encouragement_message
+            self._reminder_timer.start(1000)
         else:
             # General mode
             self.message_label.setText(CLICK_MESSAGE)
@@ -3468,90 +3319,58 @@ class Dashboard(QWidget):
             "[CLARIFICATION] UI state updated immediately, clarification processing in background"
         )
 
+    def _on_frontmost_app_changed(self):
+        """Run the focus check as soon as another app is activated"""
+        # An inactive watchdog means monitoring is off or paused by hideEvent
+        if self.focus_check_timer.isActive():
+            self._check_app_focus()
+            self.focus_check_timer.start()  # Restart the watchdog interval
+
     def _check_app_focus(self):
         """Check if user switched away from intention app"""
         if not self.focus_monitoring_enabled:
             return
 
         try:
-            from ..utils.activity import get_frontmost_app
-
             current_app = get_frontmost_app()
-            print(f"[FOCUS DEBUG] Current app: '{current_app}'")
+            logger.debug("[FOCUS] Current app: '%s'", current_app)
 
             # Filter out browser URLs to get just the app name
             if " - " in current_app:
                 current_app = current_app.split(" - ")[0]
-                print(f"[FOCUS DEBUG] App name after filtering: '{current_app}'")
+                logger.debug("[FOCUS] App name after filtering: '%s'", current_app)
 
             # Use cached intention app name
             intention_app_name = self.current_intention_app_name
 
             # Fallback if cache is empty
             if not intention_app_name:
-                from ..utils.activity import get_current_app_name
-
                 intention_app_name = get_current_app_name()
                 self.current_intention_app_name = intention_app_name
-                print(
-                    f"[FOCUS DEBUG] Fallback: got intention app name: '{intention_app_name}'"
+                logger.debug(
+                    "[FOCUS] Fallback: got intention app name: '%s'",
+                    intention_app_name,
                 )
 
-            print(f"[FOCUS DEBUG] Intention app name: '{intention_app_name}'")
+            logger.debug("[FOCUS] Intention app name: '%s'", intention_app_name)
 
-            # Check if current app is our intention app (exact match or contains our app name)
-            is_intention_app = (
-                current_app.lower() == intention_app_name.lower()
-                or intention_app_name.lower() in current_app.lower()
-                or current_app.lower() in intention_app_name.lower()
-            )
-
-            # Additional check for common development apps if the current app name is generic
-            if not is_intention_app and intention_app_name.lower() in [
-                "python",
-                "main",
-            ]:
-                intention_keywords = [
-                    "python",
-                    "pycharm",
-                    "vscode",
-                    "terminal",
-                    "iterm",
-                    "intention",
-                    "intentional",
-                    "dash",
-                    "cursor",  # Added Cursor IDE
-                    "code",  # Added VS Code variants
-                    "atom",  # Added Atom editor
-                    "sublime",  # Added Sublime Text
-                    "vim",  # Added Vim
-                    "emacs",  # Added Emacs
-                    "jupyter",  # Added Jupyter
-                    "spyder",  # Added Spyder
-                    "qtcreator",  # Added Qt Creator
-                    "qt",  # Added Qt apps
-                    "pyqt",  # Added PyQt apps
-                ]
-
-                is_intention_app = any(
-                    keyword in current_app.lower() for keyword in intention_keywords
-                )
-                print(
-                    f"[FOCUS DEBUG] Fallback keyword check result: {is_intention_app}"
-                )
+            is_intention_app = self._is_intention_app(current_app, intention_app_name)
 
-            print(f"[FOCUS DEBUG] Is intention app: {is_intention_app}")
+            logger.debug("[FOCUS] Is intention app: %s", is_intention_app)
             if not is_intention_app:
-                print(
-                    f"[FOCUS DEBUG] Current app '{current_app}' doesn't match intention app '{intention_app_name}'"
+                logger.debug(
+                    "[FOCUS] Current app '%s' doesn't match intention app '%s'",
+                    current_app,
+                    intention_app_name,
                 )
 
             if is_intention_app:
                 # User is back in intention-related app
-                if self.focus_notification_timer.isActive():
-                    self.focus_notification_timer.stop()
-                    print(
-                        "[FOCUS DEBUG] Stopped notification timer - user back in intention app"
+                if self._focus_reminder_armed:
+                    self._reset_focus_reminder()
+                    logger.debug(
+                        "[FOCUS] Reset notification timer"
+                        " - user back in intention app"
                     )
 
                 # Don't automatically close popup here - only close when dashboard is directly clicked
@@ -3563,23 +3382,18 @@ class Dashboard(QWidget):
                 #         "[FOCUS DEBUG] Automatically closed popup - user returned to app"
                 #     )
 
-                # Reset state for fresh detection when user leaves again
-                if self.app_switch_time is not None:
-                    self.app_switch_time = None
-                    print(
-                        "[FOCUS DEBUG] Reset app switch time - ready for new detection"
-                    )
-
                 self.last_frontmost_app = current_app
                 return
 
             # User is in a different app
             if self.last_frontmost_app != current_app:
                 # App changed to non-intention app
-                if self.app_switch_time is None:
-                    self.app_switch_time = time.time()
-                    print(
-                        f"[FOCUS DEBUG] Starting {self.NOTIFICATION_DELAY/1000}s timer for app: {current_app}"
+                if not self._focus_reminder_armed:
+                    self._focus_reminder_armed = True
+                    logger.debug(
+                        "[FOCUS] Starting %ss timer for app: %s",
+                        self.NOTIFICATION_DELAY / 1000,
+                        current_app,
                     )
                     self.focus_notification_timer.start(self.NOTIFICATION_DELAY)
                     print(f"[FOCUS] User switched to: {current_app}")
@@ -3589,57 +3403,102 @@ class Dashboard(QWidget):
         except Exception as e:
             print(f"[ERROR] Focus monitoring error: {e}")
 
+    def _reset_focus_reminder(self):
+        """Cancel the away-from-app countdown so the next switch re-arms it"""
+        self.focus_notification_timer.stop()
+        self._focus_reminder_armed = False
+
+    def _is_intention_app(self, current_app, intention_app_name):
+        """Whether current_app is (related to) the intention app, memoised per app"""
+        if intention_app_name != self._app_match_cache_owner:
+            self._app_match_cache.clear()
+            self._app_match_cache_owner = intention_app_name
+            self._last_app_match = (None, False)
+
+        # Focus is usually stable: same app as last check, same answer
+        last_app, last_result = self._last_app_match
+        if current_app == last_app:
+            return last_result
+
+        current_lower = current_app.lower()
+        cached = self._app_match_cache.get(current_lower)
+        if cached is not None:
+            self._last_app_match = (current_app, cached)
+            return cached
+
+        # Exact match or either name contains the other
+        intention_lower = intention_app_name.lower()
+        is_intention_app = (
+            current_lower == intention_lower
+            or intention_lower in current_lower
+            or current_lower in intention_lower
+        )
+
+        # Additional check for common development apps if the app name is generic
+        if not is_intention_app and intention_lower in ("python", "main"):
+            is_intention_app = any(
+                keyword in current_lower for keyword in _DEV_APP_KEYWORDS
+            )
+            logger.debug("[FOCUS] Fallback keyword check result: %s", is_intention_app)
+
+        if len(self._app_match_cache) >= _APP_MATCH_CACHE_SIZE:
+            self._app_match_cache.clear()
+        self._app_match_cache[current_lower] = is_intention_app
+        self._last_app_match = (current_app, is_intention_app)
+        return is_intention_app
+
     def _show_focus_popup(self):
         """Show strong popup to return to intention app"""
-        print("[FOCUS DEBUG] _show_focus_popup called")
+        logger.debug("[FOCUS] _show_focus_popup called")
 
         if not self.focus_monitoring_enabled:
-            print("[FOCUS DEBUG] Popup not shown - monitoring disabled")
+            logger.debug("[FOCUS] Popup not shown - monitoring disabled")
             return
 
         # Don't show popup during active session (when user is supposed to be working)
         if self.is_capturing:
-            print(
-                "[FOCUS DEBUG] Popup not shown - session in progress (user should be working)"
+            logger.debug(
+                "[FOCUS] Popup not shown - session in progress (user should be working)"
             )
             return
 
         # Don't show popup if rating window is visible - only show after rating is complete
         if self.is_rating_window_visible():
-            print("[FOCUS DEBUG] Popup not shown - rating window is visible")
+            logger.debug("[FOCUS] Popup not shown - rating window is visible")
             return
 
         # Don't show popup if clarification window is visible - wait until clarification is complete
         if self.is_clarification_window_visible():
-            print("[FOCUS DEBUG] Popup not shown - clarification window is visible")
+            logger.debug("[FOCUS] Popup not shown - clarification window is visible")
             return
 
         # Don't show popup if settings dialog is visible
         if self.is_settings_dialog_visible():
-            print("[FOCUS DEBUG] Popup not shown - settings dialog is visible")
+            logger.debug("[FOCUS] Popup not shown - settings dialog is visible")
             return
 
         # Don't show popup if already visible
         if self.focus_popup and self.focus_popup.isVisible():
-            print("[FOCUS DEBUG] Popup not shown - already visible")
+            logger.debug("[FOCUS] Popup not shown - already visible")
             return
 
-        # Show popup to remind user about intention setting
-        print("[FOCUS DEBUG] Creating reminder popup - user switched away from app")
-        self.focus_popup = SetIntentionReminderPopup()
+        # Show popup to remind user about intention setting (built once, then reused)
+        logger.debug("[FOCUS] Showing reminder popup - user switched away from app")
+        if self.focus_popup is None:
+            self.focus_popup = SetIntentionReminderPopup()
+            self.focus_popup.finished.connect(self._on_focus_popup_finished)
+        else:
+            self.focus_popup.center_on_screen()  # It may have been dragged last time
 
         self.focus_popup.show()
+        self._set_popup_click_filter(True)
         # Don't apply opacity to focus popup - keep it fully visible for important alerts
         # self.apply_current_opacity_to_window(self.focus_popup)
 
         # Only show notification if user has set an intention
         if self.current_task and self.current_task.strip():
-            from ..ui.notification import NotificationManager
-
             NotificationManager.show_notification(
-                title=get_text("focus_notification_title"),
-                subtitle=get_text("focus_notification_subtitle"),
-                message=get_text("focus_notification_message"),
+                **self._focus_notification_texts,
                 state=1,  # Use distracted state for focus reminder
                 dashboard=self,
                 notification_context=None,  # No context for focus reminders
@@ -3652,16 +3511,18 @@ class Dashboard(QWidget):
                 f"[FOCUS] ✅ POPUP ONLY shown - no intention set, skipping notification"
             )
 
+    def _on_focus_popup_finished(self, _result):
+        """The popup was dismissed on its own (e.g. Esc); stop watching clicks"""
+        self._set_popup_click_filter(False)
+
     def _on_focus_popup_return(self):
         """Handle return button click from focus popup"""
-        if self.focus_popup:
-            self.focus_popup.close()
-            self.focus_popup = None
+        if self.focus_popup is not None:
+            self.focus_popup.hide()
+        self._set_popup_click_filter(False)
 
         # Reset app switch detection state to allow new notifications
-        self.app_switch_time = None
-        if self.focus_notification_timer.isActive():
-            self.focus_notification_timer.stop()
+        self._reset_focus_reminder()
 
         print("[FOCUS] User clicked return to work - state reset for new detection")
 
@@ -3685,8 +3546,6 @@ class Dashboard(QWidget):
                 f"[FOCUS] Check interval: {self.FOCUS_CHECK_INTERVAL/1000}s, Notification delay: {self.NOTIFICATION_DELAY/1000}s"
             )
             self.focus_monitoring_enabled = True
-            from ..utils.activity import get_frontmost_app
-
             self.last_frontmost_app = get_frontmost_app()
             print(f"[FOCUS] Initial app: '{self.last_frontmost_app}'")
             self.focus_check_timer.start(self.FOCUS_CHECK_INTERVAL)
@@ -3700,32 +3559,33 @@ class Dashboard(QWidget):
             print("[FOCUS] Stopping focus monitoring")
             self.focus_monitoring_enabled = False
             self.focus_check_timer.stop()
-            self.focus_notification_timer.stop()
-            self.app_switch_time = None
+            self._reset_focus_reminder()
             self.last_frontmost_app = None
 
-            # Close focus popup if visible
-            if self.focus_popup and self.focus_popup.isVisible():
-                self.focus_popup.close()
-                self.focus_popup = None
+            # Hide focus popup if visible
+            if self.focus_popup is not None and self.focus_popup.isVisible():
+                self.focus_popup.hide()
+            self._set_popup_click_filter(False)
 
     def on_opacity_changed(self, value):
         """Handle opacity slider value change"""
-        # Convert slider value (20-100) to opacity (0.2-1.0)
-        opacity = value / 100.0
+        # Convert slider value (20-100) to opacity (0.2-1.0) and store it for
+        # other windows; the windows themselves are updated once per frame
+        self.current_opacity = value / 100.0
+        if not self._opacity_flush_timer.isActive():
+            self._opacity_flush_timer.start()
+
+    def _flush_opacity(self):
+        """Apply the latest slider opacity to the dashboard and visible windows"""
+        opacity = self.current_opacity
 
         # Apply opacity to the main window
         self.setWindowOpacity(opacity)
 
-        # Store current opacity for other windows
-        self.current_opacity = opacity
-
         # Apply to all currently visible windows managed by window_manager
-        if hasattr(self, "window_manager") and self.window_manager:
-            # Apply to all windows in window_manager
-            for window_name, window in self.window_manager.windows.items():
-                if window and window.isVisible():
-                    window.setWindowOpacity(opacity)
+        if self.window_manager:
+            for window in self.window_manager.visible_windows().values():
+                window.setWindowOpacity(opacity)
 
         # Don't apply opacity to focus popup - keep it fully visible for important alerts
         # if (
@@ -3735,34 +3595,42 @@ class Dashboard(QWidget):
         # ):
         #     self.focus_popup.setWindowOpacity(opacity)
 
-        print(
-            f"[UI] Opacity changed to {value}% ({opacity:.1f}) - applied to all windows"
+        logger.debug(
+            "[UI] Opacity changed to %.0f%% - applied to all windows", opacity * 100
         )
 
     def apply_current_opacity_to_window(self, window):
         """Apply current opacity setting to a specific window"""
-        if window and hasattr(self, "current_opacity"):
+        if window:
             window.setWindowOpacity(self.current_opacity)
-            print(f"[UI] Applied opacity {self.current_opacity:.1f} to new window")
+            logger.debug(
+                "[UI] Applied opacity %.1f to new window", self.current_opacity
+            )
+
+    def _show_pending_reminder(self):
+        """Show the reminder message queued for _reminder_timer"""
+        self._show_reminder_message(self._pending_reminder_message)
 
     def _show_reminder_message(self, message):
         """Show the reminder message after hiding starting soon window"""
+        # Dashboard was hidden while the reminder was pending - skip UI work
+        if not self.isVisible():
+            return
+
         # Hide starting soon window first, then show reminder message
         self.hide_starting_soon_window()
         self.show_llm_response_window(message, 0.0)  # 0.0 = focused
 
     def _close_focus_popup_on_dashboard_click(self):
         """Close focus popup when dashboard is clicked"""
-        if self.focus_popup and self.focus_popup.isVisible():
-            self.focus_popup.close()
-            self.focus_popup = None
+        self._set_popup_click_filter(False)
+        if self.focus_popup is not None and self.focus_popup.isVisible():
+            self.focus_popup.hide()
 
             # Reset app switch detection state to allow new notifications
-            self.app_switch_time = None
-            if self.focus_notification_timer.isActive():
-                self.focus_notification_timer.stop()
+            self._reset_focus_reminder()
 
-            print("[FOCUS DEBUG] Closed popup due to dashboard click")
+            logger.debug("[FOCUS] Closed popup due to dashboard click")
 
     def focusInEvent(self, event):
         """Handle focus in event when dashboard gets focus"""
@@ -3772,36 +3640,53 @@ class Dashboard(QWidget):
     def showEvent(self, event):
         """Handle show event when dashboard becomes visible"""
         super().showEvent(event)
-        # Small delay to ensure the window is fully shown before closing popup
-        QTimer.singleShot(100, self._close_focus_popup_on_dashboard_click)
 
-    def _install_event_filters(self):
-        """Install event filters on all child widgets to catch clicks"""
-        # Install on the dashboard itself
-        self.installEventFilter(self)
+        # Resume focus checks paused by hideEvent
+        if self.focus_monitoring_enabled and not self.focus_check_timer.isActive():
+            self.focus_check_timer.start(self.FOCUS_CHECK_INTERVAL)
+            print("[FOCUS] Dashboard shown - monitoring timer resumed")
 
-        # Recursively install on all child widgets
-        self._install_filter_recursive(self)
+        # Small delay to ensure the window is fully shown before closing popup
+        QTimer.singleShot(
+            100, Qt.TimerType.CoarseTimer, self._close_focus_popup_on_dashboard_click
+        )
 
-        print("[FOCUS] Event filters installed on all dashboard widgets")
+    def closeEvent(self, event):
+        """Drop the cached NSWindow, it may not survive the native window"""
+        self._ns_window = None
+        super().closeEvent(event)
 
-    def _install_filter_recursive(self, widget):
-        """Recursively install event filters on all child widgets"""
-        for child in widget.findChildren(QWidget):
-            child.installEventFilter(self)
+    def hideEvent(self, event):
+        """Pause focus checks while the dashboard is hidden"""
+        super().hideEvent(event)
+        if self.focus_check_timer.isActive():
+            self.focus_check_timer.stop()
+            self._reset_focus_reminder()
+            print("[FOCUS] Dashboard hidden - monitoring timer paused")
+
+    def _set_popup_click_filter(self, enabled):
+        """Install or remove the app-wide filter that watches for dashboard clicks"""
+        if enabled == self._popup_filter_installed:
+            return
+        if enabled:
+            QApplication.instance().installEventFilter(self)
+        else:
+            QApplication.instance().removeEventFilter(self)
+        self._popup_filter_installed = enabled
 
     def eventFilter(self, source, event):
         """Event filter to catch clicks on any child widget and close focus popup"""
-        # Check if it's a mouse press event
-        if (
-            event.type() == QEvent.Type.MouseButtonPress
-            and event.button() == Qt.MouseButton.LeftButton
-        ):
-            # Any left click on dashboard or its children should close the focus popup
-            self._close_focus_popup_on_dashboard_click()
+        # Only mouse presses matter; everything else returns before any other work
+        if event.type() != _MOUSE_PRESS:
+            return False
+
+        # Any left click on dashboard or its children should close the focus popup
+        if event.button() == _LEFT_BUTTON and isinstance(source, QWidget):
+            if source is self or self.isAncestorOf(source):
+                self._close_focus_popup_on_dashboard_click()
 
         # Continue with normal event processing
-        return super().eventFilter(source, event)
+        return False
 
     def refresh_ui_language(self):
         """Refresh all UI text when language changes"""
@@ -3812,6 +3697,21 @@ class Dashboard(QWidget):
         TYPE_MESSAGE = get_text("type_message")
         CLICK_MESSAGE = get_text("click_message")
 
+        self._load_feedback_texts()
+        self._load_focus_notification_texts()
+
+        # The focus popup bakes in its texts when built; rebuild it on next use
+        if self.focus_popup is not None:
+            self._set_popup_click_filter(False)
+            self.focus_popup.close()
+            self.focus_popup.deleteLater()
+            self.focus_popup = None
+
+        # Update cached settings menu labels (each action stores its text key)
+        if self._settings_menu is not None:
+            for action in self._settings_menu.actions():
+                action.setText(get_text(action.data()))
+
         # Update window title
         if APP_MODE == APP_MODE_FULL:
             APP_TITLE = get_text("app_title_1")
@@ -3825,119 +3725,83 @@ class Dashboard(QWidget):
         self.setWindowTitle(APP_TITLE)
 
         # Update drag bar text
-        if hasattr(self, "drag_bar"):
+        if self.drag_bar is not None:
             self.drag_bar.setText(APP_TITLE)
 
         # Update basic mode title label
-        if APP_MODE == APP_MODE_BASIC and hasattr(self, "findChild"):
-            basic_title_label = self.findChild(QLabel, "basicTitleLabel")
-            if basic_title_label:
-                basic_title_label.setText(APP_TITLE)
+        if self.basic_title_label is not None:
+            self.basic_title_label.setText(APP_TITLE)
 
         # Update placeholder text
-        if hasattr(self, "task_input"):
+        if self.task_input is not None:
             self.task_input.setPlaceholderText(TYPE_MESSAGE)
 
         # Update button texts
-        if hasattr(self, "set_button"):
+        if self.set_button is not None:
             self.set_button.setText(get_text("set_button"))
 
-        if hasattr(self, "start_button"):
+        if self.start_button is not None:
             # Check current state and set appropriate text
             current_text = self.start_button.text()
-            if current_text in ["Start", "시작"]:
+            if current_text in _START_BUTTON_TEXTS:
                 self.start_button.setText(get_text("start_button"))
-            elif current_text in ["Stop", "중지"]:
+            elif current_text in _STOP_BUTTON_TEXTS:
                 self.start_button.setText(get_text("stop_button"))
 
         # Update message labels
-        if hasattr(self, "message_label") and self.message_label.text():
+        if self.message_label is not None and self.message_label.text():
             # Only update if it contains the clickable message
             current_msg = self.message_label.text()
-            if "reset intention" in current_msg or "재설정" in current_msg:
+            if _CLICK_MESSAGE_RE.search(current_msg):
                 self.message_label.setText(CLICK_MESSAGE)
 
         # Update instruction labels
-        if hasattr(self, "instruction_label") and self.instruction_label:
+        if self.instruction_label is not None:
             current_instruction = self.instruction_label.text()
-            if (
-                "start activity" in current_instruction
-                or "시작하려면" in current_instruction
-            ):
+            if _INSTRUCTION_START_RE.search(current_instruction):
                 self.instruction_label.setText(get_text("instruction_start"))
-            elif (
-                "finish activity" in current_instruction
-                or "마무리" in current_instruction
-            ):
+            elif _INSTRUCTION_FINISH_RE.search(current_instruction):
                 self.instruction_label.setText(get_text("instruction_finish"))
 
         # Daily rating display removed - no longer showing rating in history window
 
         # Update feedback messages if feedback window is visible
         if (
-            hasattr(self, "llm_response_window")
-            and self.llm_response_window
+            self.llm_response_window is not None
             and self.llm_response_window.isVisible()
         ):
             self._update_feedback_message()
 
         # Update loading animation if currently active
         if self.loading_timer.isActive() and self.loading_message_widget:
-            loading_text = get_text("loading")
-            self.loading_message_widget.setText(
-                f"{loading_text}{'.' * self.loading_dots}"
-            )
+            self._loading_text = get_text("loading")
+            self.update_loading_animation()
 
-        # Update history window title if visible
-        if hasattr(self, "window_manager") and self.window_manager:
-            history_window = self.window_manager.windows.get("history")
-            if history_window:
-                history_title = history_window.findChild(QLabel, "historyTitle")
-                if history_title:
-                    history_title.setText(get_text("todays_intentions"))
-
-            # Update starting soon window label if visible
-            starting_soon_window = self.window_manager.windows.get("starting_soon")
-            if starting_soon_window:
-                starting_label = starting_soon_window.findChild(QLabel, "startingLabel")
-                if starting_label:
-                    starting_label.setText(get_text("starting_soon"))
-
-            # Update clarification window elements if visible
-            clarification_window = self.window_manager.windows.get("clarification")
-            if clarification_window:
-                clarification_title = clarification_window.findChild(
-                    QLabel, "clarificationTitle"
-                )
-                if clarification_title:
-                    clarification_title.setText(get_text("clarification_title").upper())
+        # Update popup window titles
+        if self.history_title is not None:
+            self.history_title.setText(get_text("todays_intentions"))
+
+        if self.starting_label is not None:
+            self.starting_label.setText(get_text("starting_soon"))
+
+        if self.clarification_title is not None:
+            self.clarification_title.setText(get_text("clarification_title").upper())
 
         # Update clarification input and send button if they exist
-        if hasattr(self, "clarification_input") and self.clarification_input:
+        if self.clarification_input is not None:
             self.clarification_input.setPlaceholderText(
                 get_text("clarification_placeholder")
             )
 
-        if (
-            hasattr(self, "clarification_send_button")
-            and self.clarification_send_button
-        ):
+        if self.clarification_send_button is not None:
             self.clarification_send_button.setText(get_text("send_button"))
 
-        # Update rating window if it exists
-        if hasattr(self, "window_manager") and self.window_manager:
-            rating_window = self.window_manager.windows.get("rating")
-            if rating_window:
-                # Update rating window title
-                rating_title = rating_window.findChild(QLabel)
-                if rating_title and rating_title.objectName() == "ratingTitle":
-                    rating_title.setText(get_text("rating_question"))
-
-                # Update rating widget text
-                if hasattr(self, "progress_bar") and hasattr(
-                    self.progress_bar, "refresh_language"
-                ):
-                    self.progress_bar.refresh_language()
+        # Update rating window title and rating widget text
+        if self.rating_title is not None:
+            self.rating_title.setText(get_text("rating_question"))
+
+        if self.progress_bar is not None:
+            self.progress_bar.refresh_language()
 
         print("[LANGUAGE] Dashboard UI language refresh complete")
 
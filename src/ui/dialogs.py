@@ -9,10 +9,32 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
+import logging
 import subprocess
 import sys
 from ..config.language import get_text
 
+logger = logging.getLogger(__name__)
+
+# Title of the Korean translation, used to pick the message language below
+_KOREAN_DISPLAY_TITLE = "다중 디스플레이 감지"
+
+# Instructions appended to the multiple display warning, by language
+_DISPLAY_INSTRUCTIONS_KO = (
+    "\n\n📋 다음 중 하나를 선택하세요:\n"
+    "• 외부 모니터 케이블 연결 해제\n"
+    "• 노트북 덮개를 닫아 외부 모니터만 사용 (클램셸 모드)\n"
+    "• 시스템 설정 > 디스플레이에서 하나의 디스플레이 비활성화\n\n"
+    "그 다음 앱을 다시 시작하세요."
+)
+_DISPLAY_INSTRUCTIONS_EN = (
+    "\n\n📋 Please choose one of these options:\n"
+    "• Disconnect external monitor cable\n"
+    "• Close laptop lid (clamshell mode) to use external monitor only\n"
+    "• Use System Settings > Displays to disable one display\n\n"
+    "Then restart the app."
+)
+
 
 class MultiDisplayDialog(QDialog):
     """Custom dialog for multiple display detection with prominent display"""
@@ -61,8 +83,10 @@ class MultiDisplayDialog(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
-        # Title
-        title_label = QLabel(get_text("multiple_display_title"))
+        # Title (its translation also tells us which language to build text in)
+        title = get_text("multiple_display_title")
+        is_korean = title == _KOREAN_DISPLAY_TITLE
+        title_label = QLabel(title)
         title_font = QFont()
         title_font.setPointSize(16)
         title_font.setBold(True)
@@ -76,27 +100,13 @@ class MultiDisplayDialog(QDialog):
         base_message = get_text("multiple_display_message")
         display_info = (
             f"\n\n현재 연결된 디스플레이 ({display_count}):\n{display_list}"
-            if get_text("multiple_display_title") == "다중 디스플레이 감지"
+            if is_korean
             else f"\n\nCurrently connected displays ({display_count}):\n{display_list}"
         )
 
         # Additional instructions based on language
         additional_instructions = (
-            (
-                "\n\n📋 다음 중 하나를 선택하세요:\n"
-                "• 외부 모니터 케이블 연결 해제\n"
-                "• 노트북 덮개를 닫아 외부 모니터만 사용 (클램셸 모드)\n"
-                "• 시스템 설정 > 디스플레이에서 하나의 디스플레이 비활성화\n\n"
-                "그 다음 앱을 다시 시작하세요."
-            )
-            if get_text("multiple_display_title") == "다중 디스플레이 감지"
-            else (
-                "\n\n📋 Please choose one of these options:\n"
-                "• Disconnect external monitor cable\n"
-                "• Close laptop lid (clamshell mode) to use external monitor only\n"
-                "• Use System Settings > Displays to disable one display\n\n"
-                "Then restart the app."
-            )
+            _DISPLAY_INSTRUCTIONS_KO if is_korean else _DISPLAY_INSTRUCTIONS_EN
         )
 
         full_message = base_message + display_info + additional_instructions
@@ -173,22 +183,15 @@ class Dialogs:
     @staticmethod
     def show_multiple_display_error(display_count, display_list):
         """Show a prominent modal dialog for multiple display detection"""
-        print(f"[DIALOGS] ===== STARTING MULTIPLE DISPLAY ERROR DIALOG =====")
-        print(f"[DIALOGS] Display count: {display_count}")
-        print(f"[DIALOGS] Display list: {display_list}")
+        logger.debug("[DIALOGS] ===== STARTING MULTIPLE DISPLAY ERROR DIALOG =====")
+        logger.debug("[DIALOGS] Display count: %s", display_count)
+        logger.debug("[DIALOGS] Display list: %s", display_list)
 
         try:
-            # Force bring to front and ensure visibility
-            app = QApplication.instance()
-            if app:
-                print(f"[DIALOGS] Processing QApplication events...")
-                app.processEvents()  # Process pending events first
-                print(f"[DIALOGS] QApplication events processed")
-
             # Use Qt dialog only (no native macOS alert to avoid app icon)
-            print(f"[DIALOGS] Creating MultiDisplayDialog...")
+            logger.debug("[DIALOGS] Creating MultiDisplayDialog...")
             dialog = MultiDisplayDialog(display_count, display_list)
-            print(f"[DIALOGS] MultiDisplayDialog created")
+            logger.debug("[DIALOGS] MultiDisplayDialog created")
 
             # Force dialog to be on top and visible
             dialog.setWindowFlags(
@@ -198,39 +201,13 @@ class Dialogs:
             )
             dialog.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, False)
 
-            # Show dialog first
-            dialog.show()
-            print(f"[DIALOGS] Dialog shown")
-
-            # Force to front multiple times with processing events between
-            if app:
-                app.processEvents()
-
-            dialog.activateWindow()
-            dialog.raise_()
-            print(f"[DIALOGS] Dialog activated and raised")
-
-            # Process events again after activation
-            if app:
-                app.processEvents()
-
-            # Force focus on the dialog
-            dialog.setFocus()
-            print(f"[DIALOGS] Dialog focused")
-
-            print(f"[DIALOGS] Dialog window flags set and shown")
-
-            # Show the dialog
-            print(f"[DIALOGS] Calling dialog.exec()...")
+            # exec() shows the dialog and runs its own event loop; showEvent
+            # activates and raises it, so no manual event pumping is needed
+            logger.debug("[DIALOGS] Calling dialog.exec()...")
             result = dialog.exec()
-            print(f"[DIALOGS] Dialog closed with result: {result}")
+            logger.debug("[DIALOGS] Dialog closed with result: %s", result)
 
-            # Process events after dialog closes
-            if app:
-                print(f"[DIALOGS] Processing events after dialog close...")
-                app.processEvents()
-
-            print(f"[DIALOGS] ===== DIALOG COMPLETED SUCCESSFULLY =====")
+            logger.debug("[DIALOGS] ===== DIALOG COMPLETED SUCCESSFULLY =====")
             return result
 
         except Exception as e:
@@ -240,23 +217,25 @@ class Dialogs:
             print(f"[ERROR] Full traceback: {traceback.format_exc()}")
 
             # Fallback to system notification if dialog fails
-            print(f"[DIALOGS] Falling back to system notification...")
+            logger.debug("[DIALOGS] Falling back to system notification...")
             title = get_text("multiple_display_title")
             subtitle = get_text("exit_app_button")
             message = (
                 f"Detected {display_count} displays. App will exit in 3 seconds."
-                if title != "다중 디스플레이 감지"
+                if title != _KOREAN_DISPLAY_TITLE
                 else f"{display_count}개의 디스플레이가 감지되었습니다. 3초 후 앱이 종료됩니다."
             )
 
-            print(f"[DIALOGS] Showing system notification: {title} - {message}")
+            logger.debug(
+                "[DIALOGS] Showing system notification: %s - %s", title, message
+            )
             rumps.notification(
                 title,
                 subtitle,
                 message,
                 sound=True,
             )
-            print(f"[DIALOGS] System notification sent")
+            logger.debug("[DIALOGS] System notification sent")
             return None
 
     @staticmethod
@@ -268,16 +247,19 @@ class Dialogs:
         button_text = get_text("exit_app_button")
 
         # Build full message with display info and instructions based on language
-        if title == "다중 디스플레이 감지":  # Korean
+        if title == _KOREAN_DISPLAY_TITLE:  # Korean
             display_info = (
-                f"\\n\\n현재 연결된 디스플레이 ({display_count}):\\n\\n{display_list}"
+                f"\n\n현재 연결된 디스플레이 ({display_count}):\n\n{display_list}"
             )
-            instructions = "\\n\\n📋 다음 중 하나를 선택하세요:\\n• 외부 모니터 케이블 연결 해제\\n• 노트북 덮개를 닫아 외부 모니터만 사용 (클램셸 모드)\\n• 시스템 설정 > 디스플레이에서 하나의 디스플레이 비활성화\\n\\n그 다음 앱을 다시 시작하세요."
+            instructions = _DISPLAY_INSTRUCTIONS_KO
         else:  # English
-            display_info = f"\\n\\nCurrently connected displays ({display_count}):\\n\\n{display_list}"
-            instructions = "\\n\\n📋 Please choose one of these options:\\n• Disconnect external monitor cable\\n• Close laptop lid (clamshell mode) to use external monitor only\\n• Use System Settings > Displays to disable one display\\n\\nThen restart the app."
+            display_info = (
+                f"\n\nCurrently connected displays ({display_count}):\n\n{display_list}"
+            )
+            instructions = _DISPLAY_INSTRUCTIONS_EN
 
-        alert_text = base_message.replace("\n", "\\n") + display_info + instructions
+        # osascript needs the newlines escaped inside the string literal
+        alert_text = (base_message + display_info + instructions).replace("\n", "\\n")
 
         script = f"""
         tell application "System Events"
@@ -289,5 +271,5 @@ class Dialogs:
             ["osascript", "-e", script], capture_output=True, text=True, timeout=35
         )
 
-        print(f"[DIALOGS] Native alert result: {result.returncode}")
+        logger.debug("[DIALOGS] Native alert result: %s", result.returncode)
         return result.returncode == 0
@@ -409,8 +409,9 @@ class FeedbackManager(QObject):
                 pass  # Use provided image_id
             else:
                 # Fallback: Get the image_id from thread_manager (latest analysis)
-                if hasattr(self.dashboard, "thread_manager") and hasattr(
-                    self.dashboard.thread_manager, "last_response_image_id"
+                if (
+                    self.dashboard is not None
+                    and self.dashboard.thread_manager is not None
                 ):
                     image_id = self.dashboard.thread_manager.last_response_image_id
 
@@ -560,6 +561,31 @@ class FeedbackManager(QObject):
         except Exception as e:
             print(f"[FEEDBACK_MESSAGE] Error sending feedback message: {str(e)}")
 
+    def submit_feedback(
+        self,
+        *,
+        message,
+        task_name,
+        llm_response,
+        image_path=None,
+        image_id=None,
+        ai_judgement=None,
+        feedback_type=None,
+        user_text=None,
+    ):
+        """Send the user's feedback message and start its reflection"""
+        # The two go to different endpoints (/feedback_message and /feedback)
+        self.send_feedback_message(message)
+        self.process_feedback(
+            task_name=task_name,
+            llm_response=llm_response,
+            image_path=image_path,
+            image_id=image_id,
+            ai_judgement=ai_judgement,
+            feedback_type=feedback_type,
+            user_text=user_text,
+        )
+
     def send_feedback_message_with_context(
         self, feedback_message, notification_context
     ):
@@ -749,7 +775,7 @@ class FeedbackManager(QObject):
             print(
                 f"[FEEDBACK] Added reflection intentions. Total: {len(self.dashboard.current_reflection_intentions)}"
             )
-            if hasattr(self.dashboard, "thread_manager"):
+            if self.dashboard.thread_manager is not None:
                 self.dashboard.thread_manager.set_reflection_data(
                     self.dashboard.current_reflection_intentions
                 )
@@ -759,7 +785,7 @@ class FeedbackManager(QObject):
             print(
                 f"[FEEDBACK] Added reflection rules. Total: {len(self.dashboard.current_reflection_rules)}"
             )
-            if hasattr(self.dashboard, "thread_manager"):
+            if self.dashboard.thread_manager is not None:
                 self.dashboard.thread_manager.set_reflection_rule(
                     self.dashboard.current_reflection_rules
                 )
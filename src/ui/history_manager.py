@@ -11,6 +11,10 @@ from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont
 
 # Import LocalStorage to get proper directory paths
 from ..logging.storage import LocalStorage
+from ..config.language import get_current_language
+
+# Upper bound on cached timeline strings before the cache is reset
+DISPLAY_CACHE_LIMIT = 200
 
 
 class TimelineWidget(QWidget):
@@ -320,6 +324,7 @@ class HistoryManager:
 
         self.real_intention_history = []
         self.current_session = None
+        self._display_cache = {}  # Formatted timeline text per record state
         self.load_intention_history()
 
     def load_intention_history(self):
@@ -566,6 +571,25 @@ class HistoryManager:
 
     def format_record_for_display(self, record):
         """Format a single record for timeline display"""
+        # Ended records never change, so reuse the text until any shown field
+        # (or the language used for the rating text) differs
+        key = (
+            record["intention"],
+            record.get("start_time"),
+            record.get("end_time"),
+            record.get("duration_minutes"),
+            record.get("rating"),
+            get_current_language(),
+        )
+        text = self._display_cache.get(key)
+        if text is None:
+            if len(self._display_cache) >= DISPLAY_CACHE_LIMIT:
+                self._display_cache.clear()
+            text = self._display_cache[key] = self._format_record(record)
+        return text
+
+    def _format_record(self, record):
+        """Build the timeline display text for a record"""
         intention = record["intention"]
         duration = record.get("duration_minutes")
         start_time = record.get("start_time")
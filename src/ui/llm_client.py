@@ -238,9 +238,7 @@ class ClarificationThread(QThread):
             # Simple request logging
             if "augment" in self.prompt.lower() or "variation" in self.prompt.lower():
                 print("[CLARIFICATION] Requesting augmentation")
-            elif hasattr(self.dashboard, "llm_client") and hasattr(
-                self.dashboard.llm_client, "clarification_manager"
-            ):
+            elif self.dashboard is not None:
                 step = self.dashboard.llm_client.clarification_manager.current_turn + 1
                 print(f"[CLARIFICATION] Question {step}/2")
             else:
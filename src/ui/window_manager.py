@@ -19,7 +19,6 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt,
-    QTimer,
     QPropertyAnimation,
     QEasingCurve,
     QParallelAnimationGroup,
@@ -38,6 +37,10 @@ ANIMATION_SLIDE_OFFSET = 20  # Slide animation offset in pixels
 DASHBOARD_WIDTH = 400  # Dashboard width
 INPUT_HEIGHT = 40  # Height for input fields and buttons
 
+# Popups that replace each other below the dashboard (animated ones hide with a fade)
+EXCLUSIVE_WINDOWS = ("history", "clarification", "starting_soon", "llm_response")
+ANIMATED_WINDOWS = frozenset(("history", "clarification"))
+
 
 class WindowManager:
     """Manages popup windows for the dashboard"""
@@ -51,7 +54,7 @@ class WindowManager:
     def create_all_windows(self):
         """Create all popup windows"""
         # Import here to avoid circular import
-        from ..config.constants import APP_MODE, APP_MODE_BASIC, APP_MODE_REMINDER
+        from ..config.constants import APP_MODE, APP_MODE_BASIC
 
         # Only create history window for non-BASIC modes
         if APP_MODE != APP_MODE_BASIC:
@@ -62,9 +65,7 @@ class WindowManager:
         self.create_llm_response_window()
         self.create_rating_window()
 
-        # Skip feedback window creation in REMINDER mode
-        if APP_MODE != APP_MODE_REMINDER:
-            self.create_feedback_window()
+        # The feedback window is built on first hover by the dashboard
 
     def create_history_window(self):
         """Create the history window that appears below the main dashboard"""
@@ -140,6 +141,7 @@ class WindowManager:
         # Store references
         self.windows["history"] = history_window
         self.opacity_effects["history"] = opacity_effect
+        self.dashboard.history_title = history_title
 
         # Drag functionality removed - only dashboard should be draggable
 
@@ -187,14 +189,11 @@ class WindowManager:
         chat_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         chat_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
-        # Chat container
-        chat_container = QWidget()
-        chat_layout = QVBoxLayout(chat_container)
-        chat_layout.setContentsMargins(0, 0, 0, 0)
-        chat_layout.setSpacing(8)
-        chat_layout.addStretch()  # Push messages to bottom initially
+        # Auto-scroll once new messages have changed the scroll range
+        chat_scrollbar = chat_scroll.verticalScrollBar()
+        chat_scrollbar.rangeChanged.connect(self.dashboard._on_chat_range_changed)
+        chat_scrollbar.valueChanged.connect(self.dashboard._on_chat_scrolled)
 
-        chat_scroll.setWidget(chat_container)
         clarification_layout.addWidget(chat_scroll)
 
         # Input area
@@ -265,6 +264,12 @@ class WindowManager:
             #clarificationSendButton:hover {
                 background-color: #FFED4E;
             }
+            /* Greyed out once clarification is complete */
+            #clarificationInput:disabled,
+            #clarificationSendButton:disabled {
+                background-color: #666666;
+                color: #999999;
+            }
             QScrollBar:vertical {
                 background-color: #3C3C3C;
                 width: 6px;
@@ -289,17 +294,33 @@ class WindowManager:
 
         # Store UI elements for dashboard access
         self.dashboard.clarification_window = clarification_window
+        self.dashboard.clarification_title = clarification_title
         self.dashboard.clarification_input = clarification_input
         self.dashboard.clarification_send_button = clarification_send_button
         self.dashboard.chat_scroll = chat_scroll
-        self.dashboard.chat_container = chat_container
-        self.dashboard.chat_layout = chat_layout
+        self.reset_chat_container()
 
         # Drag functionality removed - only dashboard should be draggable
 
         # Hide initially
         clarification_window.hide()
 
+    def reset_chat_container(self):
+        """Put a fresh, empty message container into the clarification chat"""
+        chat_container = QWidget()
+        chat_layout = QVBoxLayout(chat_container)
+        chat_layout.setContentsMargins(0, 0, 0, 0)
+        chat_layout.setSpacing(8)
+        chat_layout.addStretch()  # Push messages to bottom initially
+
+        # Drop the previous container (and all its messages) in one go
+        old_container = self.dashboard.chat_scroll.takeWidget()
+        self.dashboard.chat_scroll.setWidget(chat_container)
+        if old_container is not None:
+            old_container.deleteLater()
+        self.dashboard.chat_container = chat_container
+        self.dashboard.chat_layout = chat_layout
+
     def create_starting_soon_window(self):
         """Create starting soon window"""
         starting_soon_window = QWidget()
@@ -354,6 +375,7 @@ class WindowManager:
         # Store references
         self.windows["starting_soon"] = starting_soon_window
         self.dashboard.starting_soon_window = starting_soon_window
+        self.dashboard.starting_label = starting_label
 
         # Drag functionality removed - only dashboard should be draggable
 
@@ -427,6 +449,7 @@ class WindowManager:
         # Store references
         self.windows["llm_response"] = llm_response_window
         self.dashboard.llm_response_window = llm_response_window
+        self.dashboard.llm_response_container = llm_container
         self.dashboard.llm_response_label = llm_response_label
 
         # Drag functionality removed - only dashboard should be draggable
@@ -469,9 +492,9 @@ class WindowManager:
         # Update window and container sizes
         llm_response_window.setFixedSize(DASHBOARD_WIDTH, final_height)
 
-        llm_container = llm_response_window.findChild(QWidget, "llmContainer")
-        if llm_container:
-            llm_container.setGeometry(0, 0, DASHBOARD_WIDTH, final_height)
+        self.dashboard.llm_response_container.setGeometry(
+            0, 0, DASHBOARD_WIDTH, final_height
+        )
 
         print(
             f"[WINDOW] Adjusted LLM response height: {final_height}px for message length: {len(message)}"
@@ -553,17 +576,22 @@ class WindowManager:
         text_input_field.setFixedHeight(60)
         text_input_field.setPlaceholderText("(선택) 이유를 입력해 주세요...")
 
+        # Track whether an IME composition (e.g. Korean) is in progress
+        text_input_field.ime_composing = False
+
+        def handle_input_method(event):
+            text_input_field.ime_composing = bool(event.preeditString())
+            QTextEdit.inputMethodEvent(text_input_field, event)
+
+        text_input_field.inputMethodEvent = handle_input_method
+
         # Handle Enter key to complete IME composition before submission
         def handle_key_press(event):
             if event.key() == Qt.Key.Key_Return and not event.modifiers():
                 # Enter without modifiers - submit feedback
-                # First complete any pending IME composition
-                text_input_field.clearFocus()
-                QTimer.singleShot(
-                    50,
-                    lambda: self.dashboard.handle_text_feedback_submit(
-                        text_input_field.toPlainText()
-                    ),
+                # (the dashboard waits for any pending IME composition itself)
+                self.dashboard.handle_text_feedback_submit(
+                    text_input_field.toPlainText()
                 )
                 event.accept()
             else:
@@ -645,6 +673,12 @@ class WindowManager:
             #badFeedbackButton:hover {
                 background-color: #303030;
             }
+            #goodFeedbackButton[feedbackState="good"] {
+                border: 2px solid #28a745;
+            }
+            #badFeedbackButton[feedbackState="bad"] {
+                border: 2px solid #dc3545;
+            }
             #textQuestionLabel {
                 color: white;
                 font-size: 13px;
@@ -687,6 +721,8 @@ class WindowManager:
         self.windows["feedback"] = feedback_window
         self.opacity_effects["feedback"] = opacity_effect
         self.dashboard.feedback_window = feedback_window
+        self.dashboard.feedback_container = feedback_container
+        self.dashboard.feedback_question_label = question_label
         self.dashboard.good_feedback_button = good_button
         self.dashboard.bad_feedback_button = bad_button
         self.dashboard.text_input_container = text_input_container
@@ -772,6 +808,7 @@ class WindowManager:
         self.windows["rating"] = rating_window
         self.opacity_effects["rating"] = opacity_effect
         self.dashboard.rating_window = rating_window
+        self.dashboard.rating_title = rating_title
         self.dashboard.progress_bar = rating_widget  # Keep old name for compatibility
 
         # Drag functionality removed - only dashboard should be draggable
@@ -992,17 +1029,32 @@ class WindowManager:
 
         window.move(window_x, window_y)
 
+    def visible_windows(self):
+        """Managed windows that are currently shown, keyed by name"""
+        return {name: w for name, w in self.windows.items() if w.isVisible()}
+
     def update_all_window_positions(self):
         """Update all window positions when dashboard moves"""
-        for window_name in self.windows:
-            if self.windows[window_name].isVisible():
+        visible = self.visible_windows()
+        if not visible:
+            return
+
+        # Defer repaints until every popup has been moved
+        for window in visible.values():
+            window.setUpdatesEnabled(False)
+        try:
+            for window_name in visible:
                 self.update_window_position(window_name)
+        finally:
+            for window in visible.values():
+                window.setUpdatesEnabled(True)
 
-    def make_windows_secure(self, exclude_from_capture=True):
-        """Make all windows secure for screen capture exclusion"""
+    def make_windows_secure(self, exclude_from_capture=True, window_names=None):
+        """Make all (or the named) windows secure for screen capture exclusion"""
         if sys.platform == "darwin" and exclude_from_capture:
             try:
-                for window_name, window in self.windows.items():
+                for window_name in window_names or list(self.windows):
+                    window = self.windows.get(window_name)
                     if window:
                         native_view = objc.objc_object(c_void_p=int(window.winId()))
                         ns_window = native_view.window()
@@ -1039,6 +1091,24 @@ class WindowManager:
         if window_name in self.windows:
             self.windows[window_name].hide()
 
+    def show_exclusive(self, window_name):
+        """Hide whichever other exclusive popups are visible, then show this one"""
+        for name in EXCLUSIVE_WINDOWS:
+            if name == window_name:
+                continue
+            window = self.windows.get(name)
+            if window is None or not window.isVisible():
+                continue
+            if name in ANIMATED_WINDOWS:
+                self.hide_window_with_animation(name)
+            else:
+                self.hide_window(name)
+
+        if window_name in ANIMATED_WINDOWS:
+            self.show_window_with_animation(window_name)
+        else:
+            self.show_window(window_name)
+
     def add_drag_functionality(self, window):
         """Add mouse drag functionality to a window"""
         # Initialize drag state
@@ -1060,9 +1130,9 @@ class WindowManager:
         def mouseMoveEvent(event):
             """Handle mouse movement to move window"""
             if hasattr(window, "oldPos") and window.oldPos:
-                delta = event.globalPosition().toPoint() - window.oldPos
-                window.move(window.pos() + delta)
-                window.oldPos = event.globalPosition().toPoint()
+                new_pos = event.globalPosition().toPoint()
+                window.move(window.pos() + new_pos - window.oldPos)
+                window.oldPos = new_pos
             # Call original handler if it exists
             if original_mouse_move:
                 original_mouse_move(event)